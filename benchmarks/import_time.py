@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from argparse import ArgumentParser
+from statistics import median
+
+MODULES = ("factorio", "factorio.fields", "factorio.factories")
+LAZY_MODULES = ("faker", "pyutilkit.date_utils", "multiprocessing", "asyncio")
+
+
+def measure() -> tuple[int, set[str]]:
+    code = f"import sys, {', '.join(MODULES)}; print(*sys.modules)"
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() in MODULES and not name.startswith("  "):
+            total += int(cumulative)
+    return total, set(result.stdout.split())
+
+
+def main() -> int:
+    parser = ArgumentParser(description="Measure the import time of factorio")
+    parser.add_argument("-r", "--runs", type=int, default=10)
+    parser.add_argument("-b", "--budget", type=float, help="Budget in milliseconds")
+    args = parser.parse_args()
+
+    timings = []
+    for _ in range(args.runs):
+        microseconds, modules = measure()
+        timings.append(microseconds / 1000)
+        eager = modules.intersection(LAZY_MODULES)
+        if eager:
+            print(f"Eagerly imported: {', '.join(sorted(eager))}")
+            return 1
+
+    import_time = median(timings)
+    print(f"Import time: {import_time:.2f}ms (median of {args.runs} runs)")
+    if args.budget is not None and import_time > args.budget:
+        print(f"Budget of {args.budget:.2f}ms exceeded")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import sys
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from benchmarks.throughput import SAMPLE_FIELDS, Child, retained
+from factorio import fields
+from factorio.factories import Factory
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+@dataclass(frozen=True)
+class Result:
+    name: str
+    allocations: float
+    size: float
+
+    def __str__(self) -> str:
+        return f"{self.name:<32} {self.allocations:>12.2f} {self.size:>12.1f}"
+
+
+def make_factory() -> type[Factory[Child]]:
+    class ChildFactory(Factory[Child]):
+        a = fields.IntegerField()
+        b = fields.StringField()
+        c = fields.ChoiceField([True, False])
+
+    return ChildFactory
+
+
+def measure(name: str, function: Callable[[], object], n: int) -> Result:
+    function()
+    return Result(name, *retained(function, n))
+
+
+def benchmarks() -> Iterator[tuple[str, Callable[[], object]]]:
+    for name, sample in SAMPLE_FIELDS.items():
+        yield f"fields.{name}", sample
+    yield "fields.ChoiceField[list]", lambda: fields.ChoiceField(list(range(100)))
+    yield "factory.class", make_factory
+
+
+def main() -> int:
+    parser = ArgumentParser(description="Measure the memory footprint of fields")
+    parser.add_argument("-n", "--number", type=int, default=1000)
+    parser.add_argument("-k", "--filter", default="", help="Run matching benchmarks")
+    args = parser.parse_args()
+
+    print(f"{'benchmark':<32} {'allocs/obj':>12} {'bytes/obj':>12}")
+    for name, function in benchmarks():
+        if args.filter in name:
+            print(measure(name, function, args.number))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import json
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from tempfile import gettempdir
+from timeit import Timer
+from typing import TYPE_CHECKING
+
+from factorio import fields
+from factorio.factories import Factory
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+@dataclass
+class Child:
+    a: int
+    b: str
+    c: bool
+
+
+@dataclass
+class Parent:
+    x: int
+    y: list[Child]
+    z: Child
+
+
+class ChildFactory(Factory[Child]):
+    a = fields.IntegerField()
+    b = fields.StringField()
+    c = fields.BooleanField()
+
+
+class ParentFactory(Factory[Parent]):
+    x = fields.IntegerField()
+    y = fields.ListField(fields.FactoryField(ChildFactory), length=5)
+    z = fields.FactoryField(ChildFactory)
+
+
+class ConstantChildFactory(Factory[Child]):
+    a = fields.ConstantField(1)
+    b = fields.ConstantField("spam")
+    c = fields.ConstantField(True)  # noqa: FBT003
+
+
+SAMPLE_FIELDS: dict[str, Callable[[], Callable[[], object]]] = {
+    "ConstantField": lambda: fields.ConstantField(42),
+    "ChoiceField": lambda: fields.ChoiceField(range(100)),
+    "BooleanField": fields.BooleanField,
+    "IntegerField": fields.IntegerField,
+    "DecimalField": fields.DecimalField,
+    "FloatField": fields.FloatField,
+    "CharField": fields.CharField,
+    "StringField": fields.StringField,
+    "DateTimeField": fields.DateTimeField,
+    "NaiveDateTimeField": fields.NaiveDateTimeField,
+    "DateField": fields.DateField,
+    "TimedeltaField": fields.TimedeltaField,
+    "TimezoneField": fields.TimezoneField,
+    "TimeField": fields.TimeField,
+    "TextField": lambda: fields.TextField("name"),
+    "ListField": lambda: fields.ListField(fields.IntegerField()),
+    "TupleField": lambda: fields.TupleField(fields.IntegerField()),
+    "SetField": lambda: fields.SetField(fields.IntegerField()),
+    "DictField": lambda: fields.DictField(fields.CharField(), fields.IntegerField()),
+    "FactoryField": lambda: fields.FactoryField(ChildFactory),
+    "LazyField": lambda: fields.LazyField(lambda: 42),
+    "SequenceField": fields.SequenceField,
+    "SharedSequenceField": lambda: fields.SharedSequenceField(
+        Path(gettempdir()) / "factorio-benchmark.sequence"
+    ),
+}
+
+
+@dataclass(frozen=True)
+class Result:
+    name: str
+    per_second: float
+    allocations: float
+    size: float
+
+    def __str__(self) -> str:
+        return (
+            f"{self.name:<32} {self.per_second:>14,.0f} "
+            f"{self.allocations:>12.2f} {self.size:>12.1f}"
+        )
+
+
+def _field_classes(base: type[fields.AbstractField[object]]) -> Iterator[str]:
+    for subclass in base.__subclasses__():
+        if subclass.__module__ == fields.__name__:
+            yield subclass.__name__
+        yield from _field_classes(subclass)
+
+
+def retained(function: Callable[[], object], n: int) -> tuple[float, float]:
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    values = [function() for _ in range(n)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    statistics = after.compare_to(before, "filename")
+    allocations = sum(stat.count_diff for stat in statistics) - 1
+    size = sum(stat.size_diff for stat in statistics) - sys.getsizeof(values)
+    return allocations / n, size / n
+
+
+def measure(name: str, function: Callable[[], object], n: int) -> Result:
+    function()
+    elapsed = min(Timer(function).repeat(repeat=3, number=n))
+    return Result(name, n / elapsed, *retained(function, n))
+
+
+def benchmarks() -> Iterator[tuple[str, Callable[[], object]]]:
+    for name, sample in SAMPLE_FIELDS.items():
+        yield f"fields.{name}", sample()
+    yield "factory.build", ChildFactory.build
+    yield "factory.build[nested]", ParentFactory.build
+    yield "factory.build[constant]", ConstantChildFactory.build
+    yield "baseline.constructor", lambda: Child(a=1, b="spam", c=True)
+
+
+def compare(results: list[Result], baseline_path: Path, threshold: float) -> int:
+    baseline = {
+        item["name"]: Result(**item) for item in json.loads(baseline_path.read_text())
+    }
+    regressions = 0
+    print(f"\n{'benchmark':<32} {'baseline/s':>14} {'current/s':>14} {'change':>8}")
+    for result in results:
+        if result.name not in baseline:
+            continue
+        previous = baseline[result.name].per_second
+        change = result.per_second / previous - 1
+        marker = ""
+        if change < -threshold:
+            marker = " !"
+            regressions += 1
+        print(
+            f"{result.name:<32} {previous:>14,.0f} "
+            f"{result.per_second:>14,.0f} {change:>+8.1%}{marker}"
+        )
+    return regressions
+
+
+def main() -> int:
+    parser = ArgumentParser(description="Measure the throughput of factorio")
+    parser.add_argument("-n", "--number", type=int, default=2000)
+    parser.add_argument("-k", "--filter", default="", help="Run matching benchmarks")
+    parser.add_argument("--save", type=Path, help="Save the results as a baseline")
+    parser.add_argument("--compare", type=Path, help="Compare with a baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown that counts as a regression",
+    )
+    args = parser.parse_args()
+
+    missing = set(_field_classes(fields.AbstractField)).difference(SAMPLE_FIELDS)
+    if missing:
+        print(f"No benchmark for: {', '.join(sorted(missing))}")
+        return 1
+
+    print(f"{'benchmark':<32} {'objects/s':>14} {'allocs/obj':>12} {'bytes/obj':>12}")
+    results = []
+    for name, function in benchmarks():
+        if args.filter in name:
+            result = measure(name, function, args.number)
+            results.append(result)
+            print(result)
+
+    if args.save is not None:
+        args.save.write_text(json.dumps([asdict(result) for result in results]))
+    if args.compare is not None:
+        return 1 if compare(results, args.compare, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
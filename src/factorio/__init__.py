@@ -0,0 +1,3 @@
+from factorio.backends import RandomBackend, seed
+
+__all__ = ["RandomBackend", "seed"]
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cached_property
+from random import Random
+from threading import get_ident
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from faker import Faker
+
+Seed = int | float | str | bytes | bytearray | None
+
+
+class RandomBackend:
+    def __init__(self, seed: Seed = None, *, random: Random | None = None) -> None:
+        self.random = Random() if random is None else random  # noqa: S311
+        if seed is not None:
+            self.random.seed(seed)
+
+    @cached_property
+    def faker(self) -> Faker:
+        from faker import Faker  # noqa: PLC0415
+
+        faker = Faker()
+        faker.random = self.random  # type: ignore[attr-defined]
+        return faker
+
+    def seed(self, seed: Seed) -> None:
+        self.random.seed(seed)
+
+    def fork(self) -> RandomBackend:
+        return RandomBackend(self.random.getrandbits(64))
+
+
+class _Active:
+    __slots__ = ("backend", "claimed", "task", "thread")
+
+    def __init__(self, backend: RandomBackend) -> None:
+        self.backend = backend
+        self.task = _current_task()
+        self.thread = get_ident()
+        self.claimed = False
+
+
+_backend: ContextVar[_Active | None] = ContextVar("factorio_backend", default=None)
+
+
+def _current_task() -> object:
+    asyncio = sys.modules.get("asyncio")
+    if asyncio is None:
+        return None
+    loop = asyncio._get_running_loop()  # noqa: SLF001
+    return None if loop is None else asyncio.current_task(loop)
+
+
+def get_backend() -> RandomBackend:
+    active = _backend.get()
+    if active is None:
+        backend = RandomBackend()
+    elif active.thread == get_ident() and active.task is _current_task():
+        return active.backend
+    elif active.thread == get_ident() and active.task is None and not active.claimed:
+        active.claimed = True
+        backend = active.backend
+    else:
+        backend = active.backend.fork()
+    _backend.set(_Active(backend))
+    return backend
+
+
+@contextmanager
+def use_backend(backend: RandomBackend) -> Iterator[RandomBackend]:
+    token = _backend.set(_Active(backend))
+    try:
+        yield backend
+    finally:
+        _backend.reset(token)
+
+
+def seed(seed: Seed) -> None:
+    _backend.set(_Active(RandomBackend(seed)))
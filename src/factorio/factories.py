@@ -1,15 +1,118 @@
 from __future__ import annotations
 
 from inspect import getmro
-from typing import Generic, TypeVar
+from itertools import chain, count, repeat
+from typing import TYPE_CHECKING, ClassVar, Generic, NamedTuple, TypeVar, overload
 
+from factorio.backends import RandomBackend, get_backend, use_backend
 from factorio.fields import AbstractField
+from factorio.profiling import get_profile
+from factorio.sinks import awrite, awrite_columns, write, write_columns
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+    from os import PathLike
+
+    from factorio.profiling import Profile
+    from factorio.sinks import Format
+
+S = TypeVar("S")
 T = TypeVar("T")
+BLOCK_SIZE = 1024
+
+
+def _chunk_sizes(n: int | None, chunk_size: int) -> Iterator[int]:
+    if chunk_size < 1:
+        msg = f"Chunk size must be positive, got {chunk_size}"
+        raise ValueError(msg)
+    if n is None:
+        return repeat(chunk_size)
+    full_chunks, remainder = divmod(n, chunk_size)
+    sizes = repeat(chunk_size, full_chunks)
+    return chain(sizes, [remainder]) if remainder else sizes
+
+
+async def _aiter(items: Iterable[S]) -> AsyncIterator[S]:
+    import asyncio  # noqa: PLC0415
+
+    for item in items:
+        await asyncio.sleep(0)
+        yield item
+
+
+def _build_block(
+    factory: type[Factory[T]], n: int, seed: str, kwargs: dict[str, object]
+) -> list[T]:
+    with use_backend(RandomBackend(seed)):
+        return factory._build_batch(n, **kwargs)  # noqa: SLF001
+
+
+def _is_picklable(value: object) -> bool:
+    import pickle  # noqa: PLC0415
+
+    try:
+        pickle.dumps(value)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    return True
+
+
+def _sort_fields(
+    owner: str, fields: dict[str, AbstractField[object]]
+) -> tuple[tuple[str, AbstractField[object]], ...]:
+    order: dict[str, AbstractField[object]] = {}
+    visiting: set[str] = set()
+
+    def visit(key: str) -> None:
+        if key in order:
+            return
+        if key in visiting:
+            msg = f"Circular dependency found for {owner}.{key}"
+            raise ValueError(msg)
+        visiting.add(key)
+        for dependency in fields[key].dependencies:
+            if dependency not in fields:
+                msg = f"Unknown dependency {dependency} of {owner}.{key}"
+                raise ValueError(msg)
+            visit(dependency)
+        visiting.remove(key)
+        order[key] = fields[key]
+
+    for key in fields:
+        visit(key)
+    return tuple(order.items())
+
+
+def _get_dependent(kwargs: dict[str, object]) -> dict[str, AbstractField[object]]:
+    return {
+        key: value
+        for key, value in kwargs.items()
+        if isinstance(value, AbstractField) and value.dependencies
+    }
+
+
+class BuildPlan(NamedTuple):
+    model: type
+    fields: tuple[tuple[str, AbstractField[object]], ...]
+
+
+class FactoryMeta(type):
+    def __setattr__(cls, name: str, value: object) -> None:
+        super().__setattr__(name, value)
+        cls.reset_plan()
+
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
+        cls.reset_plan()
+
+    def reset_plan(cls) -> None:
+        if "_build_plan" in cls.__dict__:
+            type.__delattr__(cls, "_build_plan")
 
 
-class Factory(Generic[T]):
+class Factory(Generic[T], metaclass=FactoryMeta):
     Fields: type
+    random_backend: ClassVar[RandomBackend | None] = None
 
     @classmethod
     def get_model(cls) -> type[T]:
@@ -29,15 +132,354 @@ class Factory(Generic[T]):
 
         return candidates.pop()
 
+    @classmethod
+    def get_plan(cls) -> BuildPlan:
+        plan: BuildPlan | None = cls.__dict__.get("_build_plan")
+        if plan is None:
+            fields = {
+                key: value
+                for key, value in cls.__dict__.items()
+                if isinstance(value, AbstractField)
+            }
+            plan = BuildPlan(
+                model=cls.get_model(), fields=_sort_fields(cls.__name__, fields)
+            )
+            type.__setattr__(cls, "_build_plan", plan)
+        return plan
+
+    @classmethod
+    def _extend_plan(
+        cls, plan: BuildPlan, dependent: dict[str, AbstractField[object]]
+    ) -> BuildPlan:
+        fields = dict(plan.fields)
+        fields.update(dependent)
+        return plan._replace(fields=_sort_fields(cls.__name__, fields))
+
+    @classmethod
+    def _instrument(cls, profile: Profile) -> BuildPlan:
+        plan = cls.get_plan()
+        name = cls.__name__
+        return plan._replace(
+            fields=tuple(
+                (key, profile.wrap(f"{name}.{key}", value))
+                for key, value in plan.fields
+            )
+        )
+
+    @classmethod
+    def reset_fields(cls) -> None:
+        for _, field in cls.get_plan().fields:
+            field.reset()
+
+    @classmethod
+    def is_stateful(cls, **kwargs: object) -> bool:
+        fields = [value for key, value in cls.get_plan().fields if key not in kwargs]
+        fields.extend(
+            value for value in kwargs.values() if isinstance(value, AbstractField)
+        )
+        return any(field.is_stateful() for field in fields)
+
     @classmethod
     def build(cls, **kwargs: object) -> T:
-        model = cls.get_model()
-        fields = {
-            key: value()
-            for key, value in cls.__dict__.items()
-            if isinstance(value, AbstractField)
+        if cls.random_backend is not None:
+            with use_backend(cls.random_backend):
+                return cls._build(**kwargs)
+        return cls._build(**kwargs)
+
+    @classmethod
+    def _build(cls, **kwargs: object) -> T:
+        profile = get_profile()
+        if profile is None:
+            return cls._run(cls.get_plan(), kwargs)
+        with profile.timer(cls.__name__):
+            return cls._run(cls._instrument(profile), kwargs)
+
+    @classmethod
+    def _run(cls, plan: BuildPlan, kwargs: dict[str, object]) -> T:
+        return plan.model(**cls._run_values(plan, kwargs))  # type: ignore[no-any-return]
+
+    @classmethod
+    def _run_values(
+        cls, plan: BuildPlan, kwargs: dict[str, object]
+    ) -> dict[str, object]:
+        dependent = _get_dependent(kwargs)
+        if dependent:
+            others = {key: kwargs[key] for key in kwargs if key not in dependent}
+            extended = cls._run_values(cls._extend_plan(plan, dependent), others)
+            return {key: extended[key] for key in cls.get_header(kwargs)}
+
+        overrides = {
+            key: value() if isinstance(value, AbstractField) else value
+            for key, value in kwargs.items()
         }
-        for key, value in kwargs.items():
-            fields[key] = value() if isinstance(value, AbstractField) else value
+        fields: dict[str, object] = {}
+        for key, value in plan.fields:
+            if key in overrides:
+                fields[key] = overrides[key]
+                continue
+            dependencies = value.dependencies
+            if dependencies:
+                fields[key] = value.resolve(*[fields[name] for name in dependencies])
+            else:
+                fields[key] = value()
+        fields.update(overrides)
+        return fields
+
+    @classmethod
+    def get_header(cls, overrides: Iterable[str] = ()) -> tuple[str, ...]:
+        names = tuple(key for key, _ in cls.get_plan().fields)
+        return names + tuple(key for key in overrides if key not in names)
+
+    @classmethod
+    def build_raw(cls, **kwargs: object) -> tuple[object, ...]:
+        if cls.random_backend is not None:
+            with use_backend(cls.random_backend):
+                return cls._build_raw(kwargs)
+        return cls._build_raw(kwargs)
 
-        return model(**fields)
+    @classmethod
+    def _build_raw(cls, kwargs: dict[str, object]) -> tuple[object, ...]:
+        profile = get_profile()
+        if profile is None:
+            return tuple(cls._run_values(cls.get_plan(), kwargs).values())
+        with profile.timer(cls.__name__):
+            return tuple(cls._run_values(cls._instrument(profile), kwargs).values())
+
+    @classmethod
+    def build_batch(
+        cls, n: int, *, workers: int | None = None, **kwargs: object
+    ) -> list[T]:
+        if workers is not None:
+            return cls._build_parallel(n, workers, kwargs)
+        if cls.random_backend is not None:
+            with use_backend(cls.random_backend):
+                return cls._build_batch(n, **kwargs)
+        return cls._build_batch(n, **kwargs)
+
+    @classmethod
+    def _build_parallel(
+        cls, n: int, workers: int, kwargs: dict[str, object]
+    ) -> list[T]:
+        if workers < 1:
+            msg = f"Number of workers must be positive, got {workers}"
+            raise ValueError(msg)
+
+        backend = cls.random_backend or get_backend()
+        master_seed = backend.random.getrandbits(64)
+        sizes = list(_chunk_sizes(n, BLOCK_SIZE))
+        seeds = [f"{master_seed}:{index}" for index in range(len(sizes))]
+        factories = repeat(cls, len(sizes))
+        arguments = repeat(kwargs, len(sizes))
+        if workers == 1 or cls.is_stateful(**kwargs) or not _is_picklable(kwargs):
+            blocks = list(map(_build_block, factories, sizes, seeds, arguments))
+        else:
+            from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                blocks = list(
+                    executor.map(_build_block, factories, sizes, seeds, arguments)
+                )
+        return list(chain.from_iterable(blocks))
+
+    @classmethod
+    def _build_batch(cls, n: int, **kwargs: object) -> list[T]:
+        profile = get_profile()
+        if profile is None:
+            return cls._run_batch(cls.get_plan(), n, kwargs)
+        with profile.timer(cls.__name__, calls=n):
+            return cls._run_batch(cls._instrument(profile), n, kwargs)
+
+    @classmethod
+    def _run_batch(cls, plan: BuildPlan, n: int, kwargs: dict[str, object]) -> list[T]:
+        model = plan.model
+        names = cls.get_header(kwargs)
+        rows = cls._run_raw_batch(plan, n, kwargs)
+        return [model(**dict(zip(names, row, strict=True))) for row in rows]
+
+    @classmethod
+    def build_raw_batch(cls, n: int, **kwargs: object) -> list[tuple[object, ...]]:
+        if cls.random_backend is not None:
+            with use_backend(cls.random_backend):
+                return cls._build_raw_batch(n, kwargs)
+        return cls._build_raw_batch(n, kwargs)
+
+    @classmethod
+    def _build_raw_batch(
+        cls, n: int, kwargs: dict[str, object]
+    ) -> list[tuple[object, ...]]:
+        profile = get_profile()
+        if profile is None:
+            return cls._run_raw_batch(cls.get_plan(), n, kwargs)
+        with profile.timer(cls.__name__, calls=n):
+            return cls._run_raw_batch(cls._instrument(profile), n, kwargs)
+
+    @classmethod
+    def _run_raw_batch(
+        cls, plan: BuildPlan, n: int, kwargs: dict[str, object]
+    ) -> list[tuple[object, ...]]:
+        columns = cls._run_columns(plan, n, kwargs)
+        if not columns:
+            return [()] * n
+        return list(zip(*columns.values(), strict=True))
+
+    @classmethod
+    def build_columns(cls, n: int, **kwargs: object) -> dict[str, list[object]]:
+        if cls.random_backend is not None:
+            with use_backend(cls.random_backend):
+                return cls._build_columns(n, kwargs)
+        return cls._build_columns(n, kwargs)
+
+    @classmethod
+    def _build_columns(
+        cls, n: int, kwargs: dict[str, object]
+    ) -> dict[str, list[object]]:
+        profile = get_profile()
+        if profile is None:
+            return cls._run_columns(cls.get_plan(), n, kwargs)
+        with profile.timer(cls.__name__, calls=n):
+            return cls._run_columns(cls._instrument(profile), n, kwargs)
+
+    @classmethod
+    def _run_columns(
+        cls, plan: BuildPlan, n: int, kwargs: dict[str, object]
+    ) -> dict[str, list[object]]:
+        dependent = _get_dependent(kwargs)
+        if dependent:
+            others = {key: kwargs[key] for key in kwargs if key not in dependent}
+            extended = cls._run_columns(cls._extend_plan(plan, dependent), n, others)
+            return {key: extended[key] for key in cls.get_header(kwargs)}
+
+        overrides = {
+            key: value.batch(n) if isinstance(value, AbstractField) else [value] * n
+            for key, value in kwargs.items()
+        }
+        columns: dict[str, list[object]] = {}
+        for key, value in plan.fields:
+            if key in overrides:
+                columns[key] = overrides[key]
+                continue
+            dependencies = value.dependencies
+            if dependencies:
+                values = [columns[name] for name in dependencies]
+                columns[key] = value.resolve_batch(n, *values)
+            else:
+                columns[key] = value.batch(n)
+        columns.update(overrides)
+        return columns
+
+    @overload
+    @classmethod
+    def iter_build(
+        cls, n: int | None = None, chunk_size: None = None, **kwargs: object
+    ) -> Iterator[T]: ...
+
+    @overload
+    @classmethod
+    def iter_build(
+        cls, n: int | None = None, *, chunk_size: int, **kwargs: object
+    ) -> Iterator[list[T]]: ...
+
+    @classmethod
+    def iter_build(
+        cls, n: int | None = None, chunk_size: int | None = None, **kwargs: object
+    ) -> Iterator[T] | Iterator[list[T]]:
+        if chunk_size is None:
+            indices = count() if n is None else range(n)
+            return (cls.build(**kwargs) for _ in indices)
+
+        return (
+            cls.build_batch(size, workers=None, **kwargs)
+            for size in _chunk_sizes(n, chunk_size)
+        )
+
+    @classmethod
+    def dump(
+        cls,
+        n: int,
+        path: str | PathLike[str],
+        *,
+        format: Format = "jsonl",  # noqa: A002
+        chunk_size: int = 1000,
+        **kwargs: object,
+    ) -> None:
+        sizes = _chunk_sizes(n, chunk_size)
+        if format == "columnar":
+            write_columns(path, (cls.build_columns(size, **kwargs) for size in sizes))
+            return
+        chunks = (cls.build_raw_batch(size, **kwargs) for size in sizes)
+        write(path, cls.get_header(kwargs), chunks, format)
+
+    @classmethod
+    async def abuild(cls, **kwargs: object) -> T:
+        import asyncio  # noqa: PLC0415
+
+        await asyncio.sleep(0)
+        return cls.build(**kwargs)
+
+    @classmethod
+    async def abuild_batch(
+        cls, n: int, *, chunk_size: int = 1000, **kwargs: object
+    ) -> list[T]:
+        instances: list[T] = []
+        async for chunk in cls.aiter_build(n, chunk_size=chunk_size, **kwargs):
+            instances.extend(chunk)
+        return instances
+
+    @overload
+    @classmethod
+    def aiter_build(
+        cls, n: int | None = None, chunk_size: None = None, **kwargs: object
+    ) -> AsyncIterator[T]: ...
+
+    @overload
+    @classmethod
+    def aiter_build(
+        cls, n: int | None = None, *, chunk_size: int, **kwargs: object
+    ) -> AsyncIterator[list[T]]: ...
+
+    @classmethod
+    def aiter_build(
+        cls, n: int | None = None, chunk_size: int | None = None, **kwargs: object
+    ) -> AsyncIterator[T] | AsyncIterator[list[T]]:
+        if chunk_size is None:
+            return _aiter(cls.iter_build(n, chunk_size=None, **kwargs))
+        return _aiter(cls.iter_build(n, chunk_size=chunk_size, **kwargs))
+
+    @classmethod
+    async def afeed(
+        cls,
+        n: int,
+        sink: Callable[[list[T]], Awaitable[object]],
+        *,
+        chunk_size: int = 1000,
+        **kwargs: object,
+    ) -> None:
+        import asyncio  # noqa: PLC0415
+
+        pending: asyncio.Future[object] | None = None
+        try:
+            async for chunk in cls.aiter_build(n, chunk_size=chunk_size, **kwargs):
+                if pending is not None:
+                    await pending
+                pending = asyncio.ensure_future(sink(chunk))
+        finally:
+            if pending is not None:
+                await pending
+
+    @classmethod
+    async def adump(
+        cls,
+        n: int,
+        path: str | PathLike[str],
+        *,
+        format: Format = "jsonl",  # noqa: A002
+        chunk_size: int = 1000,
+        **kwargs: object,
+    ) -> None:
+        sizes = _chunk_sizes(n, chunk_size)
+        if format == "columnar":
+            columns = (cls.build_columns(size, **kwargs) for size in sizes)
+            await awrite_columns(path, _aiter(columns))
+            return
+        chunks = (cls.build_raw_batch(size, **kwargs) for size in sizes)
+        await awrite(path, cls.get_header(kwargs), _aiter(chunks), format)
@@ -1,74 +1,550 @@
 from __future__ import annotations
 
+import os
 import string
+from bisect import bisect_left
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date, datetime, time, timedelta
-from decimal import Decimal
-from secrets import choice
-from typing import TYPE_CHECKING, Generic, TypeVar, cast
+from decimal import MAX_PREC, ROUND_CEILING, ROUND_FLOOR, Context, Decimal
+from functools import cache, lru_cache, partial
+from inspect import Parameter, signature
+from threading import Lock
+from typing import TYPE_CHECKING, Generic, Literal, NamedTuple, TypeVar, cast, overload
+from weakref import WeakKeyDictionary
 from zoneinfo import ZoneInfo
 
-from faker import Faker
-from pyutilkit.date_utils import get_timezones
+from factorio.backends import get_backend
+from factorio.lib.locks import file_lock, read_counter, write_counter
+from factorio.lib.providers import PROVIDERS
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable, Iterator
+    from random import Random
 
-    from factorio.factories import Factory
+    from faker import Faker
 
-_fake = Faker()
+    from factorio.backends import RandomBackend
+    from factorio.factories import Factory
 
 K = TypeVar("K")
 T = TypeVar("T")
+Reuse = Literal["round_robin", "random"]
 UTC = ZoneInfo("UTC")
+MICROSECOND = timedelta(microseconds=1)
+EXACT = Context(prec=MAX_PREC)
+MAX_UNIQUE_ATTEMPTS = 100
+SHARED_TABLES = 256
+_SHARED_TYPES = frozenset({str, int, bytes, type(None)})
+
+
+class _UniqueRange:
+    __slots__ = ("_lock", "remaining", "size", "swaps")
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._lock = Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.remaining = self.size
+            self.swaps: dict[int, int] = {}
+
+    def draw(self, random: Random) -> int:
+        with self._lock:
+            return self._draw(random)
+
+    def batch(self, random: Random, n: int) -> list[int]:
+        with self._lock:
+            return [self._draw(random) for _ in range(n)]
+
+    def _draw(self, random: Random) -> int:
+        if not self.remaining:
+            msg = f"All {self.size} unique values have been used"
+            raise ValueError(msg)
+
+        self.remaining -= 1
+        index = random.randrange(self.remaining + 1)
+        value = self.swaps.get(index, index)
+        if index != self.remaining:
+            self.swaps[index] = self.swaps.pop(self.remaining, self.remaining)
+        else:
+            self.swaps.pop(index, None)
+        return value
+
+
+class _UniqueValues(Generic[T]):
+    __slots__ = ("_lock", "seen")
+
+    def __init__(self) -> None:
+        self.seen: set[T] = set()
+        self._lock = Lock()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.seen.clear()
+
+    def draw(self, generate: Callable[[], T]) -> T:
+        for _ in range(MAX_UNIQUE_ATTEMPTS):
+            value = generate()
+            with self._lock:
+                if value not in self.seen:
+                    self.seen.add(value)
+                    return value
+
+        msg = f"No unique value found after {MAX_UNIQUE_ATTEMPTS} attempts"
+        raise ValueError(msg)
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _LRUCache(Generic[T]):
+    __slots__ = ("_lock", "hits", "instances", "maxsize", "misses")
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.instances: OrderedDict[object, T] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: object, build: Callable[[], T]) -> T:
+        instances = self.instances
+        with self._lock:
+            if key in instances:
+                self.hits += 1
+                instances.move_to_end(key)
+                return instances[key]
+            self.misses += 1
+
+        instance = build()
+        with self._lock:
+            instance = instances.setdefault(key, instance)
+            instances.move_to_end(key)
+            if len(instances) > self.maxsize:
+                instances.popitem(last=False)
+        return instance
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            size = len(self.instances)
+            return CacheInfo(self.hits, self.misses, self.maxsize, size)
+
+
+_cache_scope: ContextVar[dict[object, _LRUCache[object]] | None] = ContextVar(
+    "cache_scope", default=None
+)
+
+
+@contextmanager
+def cache_scope() -> Iterator[None]:
+    token = _cache_scope.set({})
+    try:
+        yield
+    finally:
+        _cache_scope.reset(token)
+
+
+class _Scale(NamedTuple):
+    low: int
+    span: int
+    exponent: int
+
+
+class _Alphabet:
+    __slots__ = ("alphabet", "limit", "rejected", "table")
+
+    def __init__(self, alphabet: str) -> None:
+        size = len(alphabet)
+        self.alphabet = alphabet
+        self.limit = 256 - 256 % size
+        self.table = bytes(ord(alphabet[index % size]) for index in range(256))
+        self.rejected = bytes(range(self.limit, 256))
+
+    def sample(self, random: Random, k: int) -> str:
+        chunks = []
+        missing = k
+        while missing > 0:
+            data = random.randbytes(-(-missing * 256 // self.limit))
+            chunk = data.translate(self.table, self.rejected)
+            chunks.append(chunk)
+            missing -= len(chunk)
+        return b"".join(chunks)[:k].decode("ascii")
+
+
+@lru_cache(maxsize=SHARED_TABLES)
+def _get_alphabet(alphabet: str) -> _Alphabet:
+    return _Alphabet(alphabet)
+
+
+@lru_cache(maxsize=SHARED_TABLES)
+def _share(table: tuple[object, ...]) -> tuple[object, ...]:
+    return table
+
+
+def _intern(table: tuple[T, ...]) -> tuple[T, ...]:
+    if all(type(item) in _SHARED_TYPES for item in table):
+        return cast("tuple[T, ...]", _share(table))
+    return table
+
+
+@lru_cache(maxsize=SHARED_TABLES)
+def _get_scales(
+    min_value: Decimal, max_value: Decimal, min_length: int, max_length: int
+) -> dict[int, _Scale]:
+    scales = {}
+    for places in range(min_length, max_length + 1):
+        low = min_value.scaleb(places, EXACT).to_integral_value(ROUND_CEILING)
+        high = max_value.scaleb(places, EXACT).to_integral_value(ROUND_FLOOR)
+        if low > high:
+            msg = (
+                f"No value with {places} decimal places between "
+                f"{min_value} and {max_value}"
+            )
+            raise ValueError(msg)
+        scales[places] = _Scale(int(low), int(high - low), -places)
+    return scales
+
+
+def _is_provider(faker: Faker, name: str) -> bool:
+    return not name.startswith("_") and any(
+        callable(getattr(instance, name, None)) for instance in faker.get_providers()
+    )
+
+
+def _draw_offsets(random: Random, span: int, n: int) -> list[int]:
+    randrange = random.randrange
+    return [randrange(span + 1) for _ in range(n)]
+
+
+def _to_decimal(value: float | Decimal) -> Decimal:
+    if isinstance(value, float):
+        return Decimal(str(value))
+    return Decimal(value)
+
+
+def _to_microseconds(value: time) -> int:
+    seconds = (value.hour * 60 + value.minute) * 60 + value.second
+    return seconds * 1_000_000 + value.microsecond
+
+
+def _from_microseconds(value: int) -> time:
+    seconds, microsecond = divmod(value, 1_000_000)
+    minutes, second = divmod(seconds, 60)
+    hour, minute = divmod(minutes, 60)
+    return time(hour, minute, second, microsecond)
+
+
+@cache
+def _timezone_catalog() -> tuple[str, ...]:
+    from pyutilkit.date_utils import get_timezones  # noqa: PLC0415
+
+    return tuple(sorted(get_timezones()))
+
+
+@cache
+def get_zones(areas: tuple[str, ...]) -> tuple[ZoneInfo, ...]:
+    catalog = _timezone_catalog()
+    zones = {"UTC"} if "Etc" in areas else set()
+    for area in areas:
+        index = bisect_left(catalog, area)
+        while index < len(catalog) and catalog[index].startswith(area):
+            zones.add(catalog[index])
+            index += 1
+    return tuple(ZoneInfo(zone) for zone in sorted(zones))
 
 
 class AbstractField(Generic[T]):
+    __slots__ = ()
+
+    dependencies: tuple[str, ...] = ()
+
     def __init__(self, *args: object, **kwargs: object) -> None:
         raise NotImplementedError
 
     def __call__(self) -> T:
         raise NotImplementedError
 
+    def batch(self, n: int) -> list[T]:
+        return [self() for _ in range(n)]
+
+    def resolve(self, *values: object) -> T:  # noqa: ARG002
+        return self()
+
+    def resolve_batch(self, n: int, *columns: list[object]) -> list[T]:  # noqa: ARG002
+        return self.batch(n)
+
+    def reset(self) -> None:
+        pass
+
+    def is_stateful(self) -> bool:
+        return False
+
+
+def _get_dependencies(function: Callable[..., object]) -> tuple[str, ...]:  # type: ignore[explicit-any]
+    dependencies = []
+    for parameter in signature(function).parameters.values():
+        if parameter.kind in {Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD}:
+            msg = f"LazyField can't depend on variadic parameter {parameter.name}"
+            raise ValueError(msg)
+        if parameter.default is not Parameter.empty:
+            continue
+        if parameter.kind == Parameter.KEYWORD_ONLY:
+            msg = f"LazyField can't depend on keyword-only parameter {parameter.name}"
+            raise ValueError(msg)
+        dependencies.append(parameter.name)
+    return tuple(dependencies)
+
+
+def _check_independent(owner: str, dependencies: tuple[str, ...]) -> None:
+    if dependencies:
+        msg = f"{owner} items can't depend on other fields"
+        raise ValueError(msg)
+
+
+class LazyField(AbstractField[T]):
+    __slots__ = ("dependencies", "function")
+
+    def __init__(self, function: Callable[..., T]) -> None:  # type: ignore[explicit-any]
+        self.function = function
+        self.dependencies = _get_dependencies(function)
+
+    def __call__(self) -> T:
+        return self.function()
+
+    def resolve(self, *values: object) -> T:
+        return self.function(*values)
+
+    def resolve_batch(self, n: int, *columns: list[object]) -> list[T]:
+        if not columns:
+            return self.batch(n)
+        function = self.function
+        return [function(*row) for row in zip(*columns, strict=True)]
+
+
+class SequenceField(AbstractField[T]):
+    __slots__ = ("_counter", "_lock", "_next", "_pid", "_stop", "start", "template")
+
+    block_size = 1
+
+    @overload
+    def __init__(
+        self: SequenceField[int], start: int = 1, *, template: None = None
+    ) -> None: ...
+
+    @overload
+    def __init__(
+        self: SequenceField[str], start: int = 1, *, template: str
+    ) -> None: ...
+
+    def __init__(self, start: int = 1, *, template: str | None = None) -> None:
+        self.start = start
+        self.template = template
+        self._lock = Lock()
+        self._counter = start
+        self._next = self._stop = start
+        self._pid = os.getpid()
+
+    def __call__(self) -> T:
+        with self._lock:
+            if self._next == self._stop or self._pid != os.getpid():
+                self._refill(self.block_size)
+            value = self._next
+            self._next += 1
+        return cast(
+            "T", value if self.template is None else self.template.format(value)
+        )
+
+    def batch(self, n: int) -> list[T]:
+        values: list[int] = []
+        with self._lock:
+            if self._pid != os.getpid():
+                self._next = self._stop
+            while len(values) < n:
+                if self._next == self._stop:
+                    self._refill(max(self.block_size, n - len(values)))
+                end = min(self._stop, self._next + n - len(values))
+                values.extend(range(self._next, end))
+                self._next = end
+
+        if self.template is None:
+            return cast("list[T]", values)
+        template = self.template
+        return cast("list[T]", [template.format(value) for value in values])
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counter = self.start
+            self._next = self._stop = self.start
+
+    def is_stateful(self) -> bool:
+        return True
+
+    def _refill(self, size: int) -> None:
+        self._pid = os.getpid()
+        self._next = self._reserve(size)
+        self._stop = self._next + size
+
+    def _reserve(self, size: int) -> int:
+        start = self._counter
+        self._counter += size
+        return start
+
+
+class SharedSequenceField(SequenceField[T]):
+    __slots__ = ("block_size", "path")
+
+    @overload
+    def __init__(
+        self: SharedSequenceField[int],
+        path: str | os.PathLike[str],
+        start: int = 1,
+        *,
+        block_size: int = 1000,
+        template: None = None,
+    ) -> None: ...
+
+    @overload
+    def __init__(
+        self: SharedSequenceField[str],
+        path: str | os.PathLike[str],
+        start: int = 1,
+        *,
+        block_size: int = 1000,
+        template: str,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        start: int = 1,
+        *,
+        block_size: int = 1000,
+        template: str | None = None,
+    ) -> None:
+        if block_size < 1:
+            msg = f"Block size must be positive, got {block_size}"
+            raise ValueError(msg)
+        super().__init__(start, template=template)  # type: ignore[misc]
+        self.path = path
+        self.block_size = block_size
+
+    def __getstate__(self) -> dict[str, object]:
+        return {
+            "path": self.path,
+            "start": self.start,
+            "block_size": self.block_size,
+            "template": self.template,
+        }
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        self.__init__(**state)  # type: ignore[misc]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._next = self._stop
+
+    def is_stateful(self) -> bool:
+        return False
+
+    def _reserve(self, size: int) -> int:
+        with file_lock(self.path) as handle:
+            start = read_counter(handle, self.start)
+            write_counter(handle, start + size)
+        return start
+
 
 class ConstantField(AbstractField[T]):
+    __slots__ = ("value",)
+
     def __init__(self, value: T) -> None:
         self.value = value
 
     def __call__(self) -> T:
         return self.value
 
+    def batch(self, n: int) -> list[T]:
+        return [self.value] * n
+
 
 class ChoiceField(AbstractField[T]):
+    __slots__ = ("options",)
+
     def __init__(self, options: Iterable[T]) -> None:
-        self.options = list(options)
+        self.options = _intern(tuple(options))
 
     def __call__(self) -> T:
-        return choice(self.options)
+        return get_backend().random.choice(self.options)
+
+    def batch(self, n: int) -> list[T]:
+        return get_backend().random.choices(self.options, k=n)
 
 
 class BooleanField(AbstractField[bool]):
+    __slots__ = ("truth_probability",)
+
     def __init__(self, truth_probability: int = 50) -> None:
         self.truth_probability = truth_probability
 
     def __call__(self) -> bool:
-        return _fake.pybool(truth_probability=self.truth_probability)
+        return get_backend().faker.pybool(truth_probability=self.truth_probability)
+
+    def batch(self, n: int) -> list[bool]:
+        random = get_backend().random.random
+        threshold = self.truth_probability / 100
+        return [random() < threshold for _ in range(n)]
 
 
 class IntegerField(AbstractField[int]):
+    __slots__ = ("max_value", "min_value", "step", "unique_values", "values")
+
     def __init__(
-        self, min_value: int = 1, max_value: int = 9999, step: int = 1
+        self,
+        min_value: int = 1,
+        max_value: int = 9999,
+        step: int = 1,
+        *,
+        unique: bool = False,
     ) -> None:
         self.min_value = min_value
         self.max_value = max_value
         self.step = step
+        self.values = range(min_value, max_value + 1, step)
+        self.unique_values = _UniqueRange(len(self.values)) if unique else None
 
     def __call__(self) -> int:
-        return _fake.pyint(
+        if self.unique_values is not None:
+            return self.values[self.unique_values.draw(get_backend().random)]
+        return get_backend().faker.pyint(
             min_value=self.min_value, max_value=self.max_value, step=self.step
         )
 
+    def batch(self, n: int) -> list[int]:
+        random = get_backend().random
+        if self.unique_values is not None:
+            values = self.values
+            return [values[index] for index in self.unique_values.batch(random, n)]
+        values = self.values
+        return [values[offset] for offset in _draw_offsets(random, len(values) - 1, n)]
+
+    def reset(self) -> None:
+        if self.unique_values is not None:
+            self.unique_values.reset()
+
+    def is_stateful(self) -> bool:
+        return self.unique_values is not None
+
 
 class DecimalField(AbstractField[Decimal]):
+    __slots__ = ("_scales", "max_length", "max_value", "min_length", "min_value")
+
     def __init__(
         self,
         min_value: float | Decimal = 0,
@@ -76,30 +552,57 @@ class DecimalField(AbstractField[Decimal]):
         accuracy: int = 3,
         variation: int = 0,
     ) -> None:
-        self.min_value = Decimal(min_value)
-        self.max_value = Decimal(max_value)
+        self.min_value = _to_decimal(min_value)
+        self.max_value = _to_decimal(max_value)
         self.min_length = accuracy - variation
         self.max_length = accuracy + variation
+        self._scales = _get_scales(
+            self.min_value, self.max_value, self.min_length, self.max_length
+        )
 
     def __call__(self) -> Decimal:
-        right_digits = _fake.pyint(min_value=self.min_length, max_value=self.max_length)
-        return _fake.pydecimal(
-            min_value=self.min_value,
-            max_value=self.max_value,
-            right_digits=right_digits,
-        )
+        random = get_backend().random
+        scale = self._scales[random.randint(self.min_length, self.max_length)]
+        value = scale.low + random.randrange(scale.span + 1)
+        return Decimal(value).scaleb(scale.exponent, EXACT)
+
+    def batch(self, n: int) -> list[Decimal]:
+        random = get_backend().random
+        if self.min_length == self.max_length:
+            low, span, exponent = self._scales[self.min_length]
+            offsets = _draw_offsets(random, span, n)
+            return [Decimal(low + offset).scaleb(exponent, EXACT) for offset in offsets]
+
+        randrange = random.randrange
+        values = []
+        for places in _draw_lengths(self.min_length, self.max_length, n):
+            low, span, exponent = self._scales[places]
+            value = low + randrange(span + 1)
+            values.append(Decimal(value).scaleb(exponent, EXACT))
+        return values
 
 
 class FloatField(AbstractField[float]):
+    __slots__ = ("max_value", "min_value")
+
     def __init__(self, min_value: float = 0, max_value: float = 9999) -> None:
         self.min_value = min_value
         self.max_value = max_value
 
     def __call__(self) -> float:
-        return _fake.pyfloat(min_value=self.min_value, max_value=self.max_value)
+        return get_backend().faker.pyfloat(
+            min_value=self.min_value, max_value=self.max_value
+        )
+
+    def batch(self, n: int) -> list[float]:
+        random = get_backend().random.random
+        width = self.max_value - self.min_value
+        return [self.min_value + width * random() for _ in range(n)]
 
 
 class CharField(AbstractField[str]):
+    __slots__ = ("_alphabet", "alphabet")
+
     def __init__(
         self, *, include_uppercase: bool = False, include_digits: bool = False
     ) -> None:
@@ -109,34 +612,80 @@ class CharField(AbstractField[str]):
         if include_digits:
             alphabet += string.digits
         self.alphabet = alphabet
+        self._alphabet = _get_alphabet(alphabet)
 
     def __call__(self) -> str:
-        return choice(self.alphabet)
+        return get_backend().random.choice(self.alphabet)
+
+    def batch(self, n: int) -> list[str]:
+        return list(self._alphabet.sample(get_backend().random, n))
 
 
 class StringField(AbstractField[str]):
+    __slots__ = (
+        "_alphabet",
+        "max_chars",
+        "min_chars",
+        "prefix",
+        "suffix",
+        "unique_values",
+    )
+
     def __init__(
         self,
         min_chars: int = 1,
         max_chars: int = 20,
         prefix: str = "",
         suffix: str = "",
+        *,
+        unique: bool = False,
     ) -> None:
         self.min_chars = min_chars
         self.max_chars = max_chars
         self.prefix = prefix
         self.suffix = suffix
+        self.unique_values: _UniqueValues[str] | None = (
+            _UniqueValues() if unique else None
+        )
+        self._alphabet = _get_alphabet(string.ascii_letters)
 
     def __call__(self) -> str:
-        return _fake.pystr(
-            min_chars=self.min_chars,
-            max_chars=self.max_chars,
-            prefix=self.prefix,
-            suffix=self.suffix,
-        )
+        if self.unique_values is not None:
+            return self.unique_values.draw(self._generate)
+        return self._generate()
+
+    def batch(self, n: int) -> list[str]:
+        if self.unique_values is not None:
+            return super().batch(n)
+
+        random = get_backend().random
+        lengths = _draw_lengths(self.min_chars, self.max_chars, n)
+        text = self._alphabet.sample(random, sum(lengths))
+        prefix, suffix = self.prefix, self.suffix
+        values = []
+        start = 0
+        for length in lengths:
+            end = start + length
+            values.append(f"{prefix}{text[start:end]}{suffix}")
+            start = end
+        return values
+
+    def _generate(self) -> str:
+        random = get_backend().random
+        length = random.randint(self.min_chars, self.max_chars)
+        return f"{self.prefix}{self._alphabet.sample(random, length)}{self.suffix}"
+
+    def reset(self) -> None:
+        if self.unique_values is not None:
+            self.unique_values.reset()
+
+    def is_stateful(self) -> bool:
+        return self.unique_values is not None
 
 
 class DateTimeField(AbstractField[datetime]):
+    __slots__ = ("_span", "max_datetime", "min_datetime", "timezone")
+
     def __init__(
         self,
         min_datetime: datetime = datetime(2010, 1, 1, tzinfo=UTC),
@@ -145,15 +694,28 @@ class DateTimeField(AbstractField[datetime]):
         self.timezone = min_datetime.tzinfo
         self.min_datetime = min_datetime.astimezone(UTC)
         self.max_datetime = max_datetime.astimezone(UTC)
+        self._span = (self.max_datetime - self.min_datetime) // MICROSECOND
 
     def __call__(self) -> datetime:
-        naive_datetime = _fake.date_time_between_dates(
-            self.min_datetime, self.max_datetime
-        )
-        return naive_datetime.replace(tzinfo=self.timezone)
+        offset = get_backend().random.randrange(self._span + 1)
+        return self._convert(self.min_datetime + timedelta(microseconds=offset))
+
+    def batch(self, n: int) -> list[datetime]:
+        start = self.min_datetime
+        offsets = _draw_offsets(get_backend().random, self._span, n)
+        return [
+            self._convert(start + timedelta(microseconds=offset)) for offset in offsets
+        ]
+
+    def _convert(self, value: datetime) -> datetime:
+        if self.timezone is None:
+            return value.astimezone().replace(tzinfo=None)
+        return value.astimezone(self.timezone)
 
 
 class NaiveDateTimeField(AbstractField[datetime]):
+    __slots__ = ("_span", "max_datetime", "min_datetime")
+
     def __init__(
         self,
         min_datetime: datetime = datetime(2010, 1, 1),  # noqa: DTZ001
@@ -161,23 +723,40 @@ class NaiveDateTimeField(AbstractField[datetime]):
     ) -> None:
         self.min_datetime = min_datetime.replace(tzinfo=None)
         self.max_datetime = max_datetime.replace(tzinfo=None)
+        self._span = (self.max_datetime - self.min_datetime) // MICROSECOND
 
     def __call__(self) -> datetime:
-        return _fake.date_time_between_dates(self.min_datetime, self.max_datetime)
+        offset = get_backend().random.randrange(self._span + 1)
+        return self.min_datetime + timedelta(microseconds=offset)
+
+    def batch(self, n: int) -> list[datetime]:
+        start = self.min_datetime
+        offsets = _draw_offsets(get_backend().random, self._span, n)
+        return [start + timedelta(microseconds=offset) for offset in offsets]
 
 
 class DateField(AbstractField[date]):
+    __slots__ = ("_ordinals", "max_date", "min_date")
+
     def __init__(
         self, min_date: date = date(2010, 1, 1), max_date: date = date(2030, 12, 31)
     ) -> None:
         self.min_date = min_date
         self.max_date = max_date
+        self._ordinals = range(min_date.toordinal(), max_date.toordinal() + 1)
 
     def __call__(self) -> date:
-        return _fake.date_between_dates(self.min_date, self.max_date)
+        return date.fromordinal(get_backend().random.choice(self._ordinals))
+
+    def batch(self, n: int) -> list[date]:
+        ordinals = self._ordinals
+        offsets = _draw_offsets(get_backend().random, len(ordinals) - 1, n)
+        return [date.fromordinal(ordinals[offset]) for offset in offsets]
 
 
 class TimedeltaField(AbstractField[timedelta]):
+    __slots__ = ("_span", "max_timedelta", "min_timedelta")
+
     def __init__(
         self,
         min_timedelta: timedelta = timedelta(0),
@@ -185,15 +764,24 @@ class TimedeltaField(AbstractField[timedelta]):
     ) -> None:
         self.min_timedelta = min_timedelta
         self.max_timedelta = max_timedelta
+        self._span = (max_timedelta - min_timedelta) // MICROSECOND
 
     def __call__(self) -> timedelta:
-        timedelta = _fake.time_delta(self.max_timedelta - self.min_timedelta)
-        return self.min_timedelta + timedelta
+        offset = get_backend().random.randrange(self._span + 1)
+        return self.min_timedelta + timedelta(microseconds=offset)
+
+    def batch(self, n: int) -> list[timedelta]:
+        start = self.min_timedelta
+        offsets = _draw_offsets(get_backend().random, self._span, n)
+        return [start + timedelta(microseconds=offset) for offset in offsets]
 
 
 class TimezoneField(AbstractField[ZoneInfo]):
+    __slots__ = ("_zones", "areas")
+
     def __init__(self, areas: tuple[str, ...] = ()) -> None:
-        areas = areas or (
+        self._zones: tuple[ZoneInfo, ...] | None = None
+        self.areas = _intern(tuple(areas)) or (
             "Africa",
             "America",
             "Antarctica",
@@ -206,103 +794,394 @@ class TimezoneField(AbstractField[ZoneInfo]):
             "Pacific",
             "Etc",
         )
-        self.valid_zones = [
-            ZoneInfo(zone)
-            for zone in get_timezones()
-            if any(zone.startswith(area) for area in areas)
-            or (zone == "UTC" and "Etc" in areas)
-        ]
+
+    @property
+    def valid_zones(self) -> tuple[ZoneInfo, ...]:
+        if self._zones is None:
+            self._zones = get_zones(self.areas)
+        return self._zones
 
     def __call__(self) -> ZoneInfo:
-        return choice(self.valid_zones)
+        return get_backend().random.choice(self.valid_zones)
 
 
 class TimeField(AbstractField[time]):
+    __slots__ = ("_microseconds", "max_time", "min_time")
+
     def __init__(
         self, *, min_time: time = time(0), max_time: time = time(23, 59, 59, 999999)
     ) -> None:
-        self._day = date(1970, 1, 1)
         self.min_time = min_time
         self.max_time = max_time
-        self._min_datetime = datetime.combine(self._day, self.min_time)
-        self._max_datetime = datetime.combine(self._day, self.max_time)
+        self._microseconds = range(
+            _to_microseconds(min_time), _to_microseconds(max_time) + 1
+        )
 
     def __call__(self) -> time:
-        timedelta = _fake.time_delta(self._max_datetime - self._min_datetime)
-        return (self._min_datetime + timedelta).time()
+        return _from_microseconds(get_backend().random.choice(self._microseconds))
+
+    def batch(self, n: int) -> list[time]:
+        microseconds = self._microseconds
+        offsets = _draw_offsets(get_backend().random, len(microseconds) - 1, n)
+        return [_from_microseconds(microseconds[offset]) for offset in offsets]
 
 
 class TextField(AbstractField[str]):
-    def __init__(self, text_type: str, **kwargs: object) -> None:
+    __slots__ = ("_bound", "_last", "kwargs", "provider", "text_type", "unique_values")
+
+    def __init__(
+        self, text_type: str, *, unique: bool = False, **kwargs: object
+    ) -> None:
         self.text_type = text_type
+        self.provider = text_type.lower().replace(" ", "_").replace("-", "_")
+        if self.provider not in PROVIDERS and not _is_provider(
+            get_backend().faker, self.provider
+        ):
+            msg = f"Unknown text type: {text_type}"
+            raise ValueError(msg)
         self.kwargs = kwargs
+        self.unique_values: _UniqueValues[str] | None = (
+            _UniqueValues() if unique else None
+        )
+        self._bound: WeakKeyDictionary[RandomBackend, Callable[[], str]] = (
+            WeakKeyDictionary()
+        )
+        self._last: tuple[RandomBackend, Callable[[], str]] | None = None
 
     def __call__(self) -> str:
-        relaxed = self.text_type.lower().replace(" ", "_").replace("-", "_")
-        faker = getattr(_fake, relaxed)
-        return cast("str", faker(**self.kwargs))
+        if self.unique_values is not None:
+            return self.unique_values.draw(self._generate)
+        return self._generate()
+
+    def _generate(self) -> str:
+        backend = get_backend()
+        last = self._last
+        if last is not None and last[0] is backend:
+            return last[1]()
+
+        generate = self._bound.get(backend)
+        if generate is None:
+            faker = backend.faker
+            if not _is_provider(faker, self.provider):
+                msg = f"Unknown text type: {self.text_type}"
+                raise ValueError(msg)
+            generate = partial(getattr(faker, self.provider), **self.kwargs)
+            self._bound[backend] = generate
+        self._last = (backend, generate)
+        return generate()
+
+    def reset(self) -> None:
+        if self.unique_values is not None:
+            self.unique_values.reset()
+
+    def is_stateful(self) -> bool:
+        return self.unique_values is not None
+
+
+def _draw_lengths(min_length: int, max_length: int, n: int) -> list[int]:
+    if min_length == max_length:
+        return [min_length] * n
+    lengths = range(min_length, max_length + 1)
+    return get_backend().random.choices(lengths, k=n)
+
+
+def _split(values: list[T], lengths: list[int]) -> list[list[T]]:
+    chunks = []
+    start = 0
+    for length in lengths:
+        end = start + length
+        chunks.append(values[start:end])
+        start = end
+    return chunks
+
+
+def _fill(length: int, size: Callable[[], int], top_up: Callable[[int], None]) -> None:
+    attempts = 0
+    while (current := size()) < length:
+        top_up(length - current)
+        if size() > current:
+            attempts = 0
+            continue
+
+        attempts += 1
+        if attempts == MAX_UNIQUE_ATTEMPTS:
+            msg = (
+                f"Only {current} of {length} distinct values found "
+                f"after {MAX_UNIQUE_ATTEMPTS} attempts"
+            )
+            raise ValueError(msg)
 
 
 class ListField(AbstractField[list[T]]):
+    __slots__ = ("field", "max_length", "min_length")
+
     def __init__(
         self, field: AbstractField[T], length: int = 5, variation: int = 0
     ) -> None:
+        _check_independent("ListField", field.dependencies)
         self.field = field
         self.min_length = length - variation
         self.max_length = length + variation
 
     def __call__(self) -> list[T]:
-        length = _fake.pyint(min_value=self.min_length, max_value=self.max_length)
-        return [self.field() for _ in range(length)]
+        (length,) = _draw_lengths(self.min_length, self.max_length, 1)
+        return self.field.batch(length)
+
+    def batch(self, n: int) -> list[list[T]]:
+        lengths = _draw_lengths(self.min_length, self.max_length, n)
+        return _split(self.field.batch(sum(lengths)), lengths)
+
+    def is_stateful(self) -> bool:
+        return self.field.is_stateful()
 
 
 class TupleField(AbstractField[tuple[T, ...]]):
+    __slots__ = ("field", "max_length", "min_length")
+
     def __init__(
         self, field: AbstractField[T], length: int = 5, variation: int = 0
     ) -> None:
+        _check_independent("TupleField", field.dependencies)
         self.field = field
         self.min_length = length - variation
         self.max_length = length + variation
 
     def __call__(self) -> tuple[T, ...]:
-        length = _fake.pyint(min_value=self.min_length, max_value=self.max_length)
-        return tuple(self.field() for _ in range(length))
+        (length,) = _draw_lengths(self.min_length, self.max_length, 1)
+        return tuple(self.field.batch(length))
+
+    def batch(self, n: int) -> list[tuple[T, ...]]:
+        lengths = _draw_lengths(self.min_length, self.max_length, n)
+        values = self.field.batch(sum(lengths))
+        return [tuple(chunk) for chunk in _split(values, lengths)]
+
+    def is_stateful(self) -> bool:
+        return self.field.is_stateful()
 
 
 class SetField(AbstractField[set[T]]):
+    __slots__ = ("exact", "field", "max_length", "min_length")
+
     def __init__(
-        self, field: AbstractField[T], length: int = 5, variation: int = 0
+        self,
+        field: AbstractField[T],
+        length: int = 5,
+        variation: int = 0,
+        *,
+        exact: bool = False,
     ) -> None:
+        _check_independent("SetField", field.dependencies)
         self.field = field
         self.min_length = length - variation
         self.max_length = length + variation
+        self.exact = exact
 
     def __call__(self) -> set[T]:
-        length = _fake.pyint(min_value=self.min_length, max_value=self.max_length)
-        return {self.field() for _ in range(length)}
+        return self.batch(1)[0]
+
+    def batch(self, n: int) -> list[set[T]]:
+        lengths = _draw_lengths(self.min_length, self.max_length, n)
+        values = self.field.batch(sum(lengths))
+        sets = [set(chunk) for chunk in _split(values, lengths)]
+        if self.exact:
+            for length, values_set in zip(lengths, sets, strict=True):
+                self._fill(values_set, length)
+        return sets
+
+    def _fill(self, values: set[T], length: int) -> None:
+        _fill(length, values.__len__, lambda k: values.update(self.field.batch(k)))
+
+    def is_stateful(self) -> bool:
+        return self.field.is_stateful()
 
 
 class DictField(AbstractField[dict[K, T]]):
+    __slots__ = ("exact", "key_field", "max_length", "min_length", "value_field")
+
     def __init__(
         self,
         key_field: AbstractField[K],
         value_field: AbstractField[T],
         length: int = 5,
         variation: int = 0,
+        *,
+        exact: bool = False,
     ) -> None:
+        _check_independent(
+            "DictField", key_field.dependencies + value_field.dependencies
+        )
         self.key_field = key_field
         self.value_field = value_field
         self.min_length = length - variation
         self.max_length = length + variation
+        self.exact = exact
 
     def __call__(self) -> dict[K, T]:
-        length = _fake.pyint(min_value=self.min_length, max_value=self.max_length)
-        return {self.key_field(): self.value_field() for _ in range(length)}
+        return self.batch(1)[0]
+
+    def batch(self, n: int) -> list[dict[K, T]]:
+        lengths = _draw_lengths(self.min_length, self.max_length, n)
+        total = sum(lengths)
+        keys = _split(self.key_field.batch(total), lengths)
+        values = _split(self.value_field.batch(total), lengths)
+        dicts = [
+            dict(zip(chunk_keys, chunk_values, strict=True))
+            for chunk_keys, chunk_values in zip(keys, values, strict=True)
+        ]
+        if self.exact:
+            for length, values_dict in zip(lengths, dicts, strict=True):
+                self._fill(values_dict, length)
+        return dicts
+
+    def _fill(self, values: dict[K, T], length: int) -> None:
+        def top_up(k: int) -> None:
+            keys = self.key_field.batch(k)
+            for key, value in zip(keys, self.value_field.batch(k), strict=True):
+                values.setdefault(key, value)
+
+        _fill(length, values.__len__, top_up)
+
+    def is_stateful(self) -> bool:
+        return self.key_field.is_stateful() or self.value_field.is_stateful()
 
 
 class FactoryField(AbstractField[T]):
-    def __init__(self, factory: type[Factory[T]]) -> None:
+    __slots__ = (
+        "_cache",
+        "cache",
+        "factory",
+        "index",
+        "key",
+        "pool",
+        "pool_size",
+        "refresh",
+        "reuse",
+        "uses",
+    )
+
+    def __init__(
+        self,
+        factory: type[Factory[T]],
+        *,
+        pool_size: int | None = None,
+        reuse: Reuse = "round_robin",
+        refresh: int | None = None,
+        cache: int | None = None,
+        key: str | None = None,
+    ) -> None:
+        if pool_size is not None and cache is not None:
+            msg = "A field can't have both a pool and a cache"
+            raise ValueError(msg)
+        if cache is not None and cache < 1:
+            msg = f"Cache size must be positive, got {cache}"
+            raise ValueError(msg)
+        if (cache is None) != (key is None):
+            msg = "A cache and a key must be given together"
+            raise ValueError(msg)
+        if key is not None:
+            key_field = dict(factory.get_plan().fields).get(key)
+            if key_field is None:
+                msg = f"Unknown cache key: {key}"
+                raise ValueError(msg)
+            if key_field.dependencies:
+                msg = f"Cache key {key} can't depend on other fields"
+                raise ValueError(msg)
+        if pool_size is not None and pool_size < 1:
+            msg = f"Pool size must be positive, got {pool_size}"
+            raise ValueError(msg)
+        if reuse not in {"round_robin", "random"}:
+            msg = f"Unknown reuse policy: {reuse}"
+            raise ValueError(msg)
+        if refresh is not None and refresh < 1:
+            msg = f"Refresh must be positive, got {refresh}"
+            raise ValueError(msg)
+
         self.factory = factory
+        self.pool_size = pool_size
+        self.reuse = reuse
+        self.refresh = refresh
+        self.cache = cache
+        self.key = key
+        self.pool: list[T] = []
+        self.uses: list[int] = []
+        self.index = 0
+        self._cache = None if cache is None else _LRUCache[T](cache)
 
     def __call__(self) -> T:
-        return self.factory.build()
+        if self.cache is not None:
+            return self._lookup(1)[0]
+        if self.pool_size is None:
+            return self.factory.build()
+        return self._draw(self.pool_size)
+
+    def batch(self, n: int) -> list[T]:
+        if self.cache is not None:
+            return self._lookup(n)
+        if self.pool_size is None:
+            return self.factory.build_batch(n)
+        if self.refresh is not None:
+            return [self._draw(self.pool_size) for _ in range(n)]
+
+        pool = self._get_pool(self.pool_size)
+        if self.reuse == "random":
+            return get_backend().random.choices(pool, k=n)
+        start = self.index
+        self.index = (start + n) % self.pool_size
+        rotated = pool[start:] + pool[:start]
+        return (rotated * (n // self.pool_size + 1))[:n]
+
+    def reset(self) -> None:
+        self.pool = []
+        self.uses = []
+        self.index = 0
+        if self.cache is not None:
+            self._cache = _LRUCache(self.cache)
+
+    def is_stateful(self) -> bool:
+        if self.pool_size is not None or self.cache is not None:
+            return True
+        return self.factory.random_backend is not None or self.factory.is_stateful()
+
+    def cache_info(self) -> CacheInfo:
+        lru_cache = self._get_cache()
+        if lru_cache is None:
+            msg = "The field has no cache"
+            raise ValueError(msg)
+        return lru_cache.info()
+
+    def _get_cache(self) -> _LRUCache[T] | None:
+        scope = _cache_scope.get()
+        if scope is None or self.cache is None:
+            return self._cache
+        if self not in scope:
+            scope[self] = _LRUCache(self.cache)
+        return cast("_LRUCache[T]", scope[self])
+
+    def _lookup(self, n: int) -> list[T]:
+        lru_cache = cast("_LRUCache[T]", self._get_cache())
+        key = cast("str", self.key)
+        keys = dict(self.factory.get_plan().fields)[key].batch(n)
+        build = self.factory.build
+        return [lru_cache.get(value, partial(build, **{key: value})) for value in keys]
+
+    def _get_pool(self, pool_size: int) -> list[T]:
+        if not self.pool:
+            self.pool = self.factory.build_batch(pool_size)
+            self.uses = [0] * pool_size
+        return self.pool
+
+    def _draw(self, pool_size: int) -> T:
+        pool = self._get_pool(pool_size)
+        if self.reuse == "random":
+            index = get_backend().random.randrange(pool_size)
+        else:
+            index = self.index
+            self.index = (index + 1) % pool_size
+
+        instance = pool[index]
+        if self.refresh is not None:
+            self.uses[index] += 1
+            if self.uses[index] >= self.refresh:
+                pool[index] = self.factory.build()
+                self.uses[index] = 0
+        return instance
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import os
+import sys
+from contextlib import contextmanager
+from typing import IO, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+@contextmanager
+def file_lock(path: str | os.PathLike[str]) -> Iterator[IO[bytes]]:
+    descriptor = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    with os.fdopen(descriptor, "r+b") as handle:
+        if sys.platform == "win32":  # pragma: no cover
+            import msvcrt  # noqa: PLC0415
+
+            msvcrt.locking(descriptor, msvcrt.LK_LOCK, 1)
+            try:
+                yield handle
+            finally:
+                handle.flush()
+                handle.seek(0)
+                msvcrt.locking(descriptor, msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl  # noqa: PLC0415
+
+            fcntl.flock(descriptor, fcntl.LOCK_EX)
+            try:
+                yield handle
+            finally:
+                handle.flush()
+                fcntl.flock(descriptor, fcntl.LOCK_UN)
+
+
+def read_counter(handle: IO[bytes], default: int) -> int:
+    handle.seek(0)
+    data = handle.read().strip()
+    return int(data) if data else default
+
+
+def write_counter(handle: IO[bytes], value: int) -> None:
+    handle.seek(0)
+    handle.truncate()
+    handle.write(str(value).encode())
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol, TypeVar, cast
+
+from factorio.factories import _chunk_sizes
+from factorio.fields import FactoryField
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from factorio.factories import Factory
+
+T = TypeVar("T")
+AnyFactory = type["Factory[object]"]
+
+
+class Cursor(Protocol):
+    def executemany(
+        self, operation: str, seq_of_parameters: Iterable[Sequence[object]], /
+    ) -> object: ...
+
+    def close(self) -> object: ...
+
+
+class Connection(Protocol):
+    def cursor(self) -> Cursor: ...
+
+
+def get_table(model: type) -> str:
+    return str(getattr(model, "__tablename__", model.__name__.lower()))
+
+
+def get_foreign_keys(
+    factory: AnyFactory, overrides: Mapping[str, object] | None = None
+) -> dict[str, AnyFactory]:
+    overrides = overrides or {}
+    fields: list[tuple[str, object]] = [
+        (key, value) for key, value in factory.get_plan().fields if key not in overrides
+    ]
+    fields.extend(overrides.items())
+    return {
+        key: value.factory for key, value in fields if isinstance(value, FactoryField)
+    }
+
+
+def dependency_order(
+    factory: type[Factory[T]], overrides: Mapping[str, object] | None = None
+) -> list[AnyFactory]:
+    order: list[AnyFactory] = []
+    visiting: set[AnyFactory] = set()
+
+    def visit(current: AnyFactory, overrides: Mapping[str, object] | None) -> None:
+        if current in order:
+            return
+        if current in visiting:
+            msg = f"Circular dependency found for {current.__name__}"
+            raise ValueError(msg)
+        visiting.add(current)
+        for dependency in get_foreign_keys(current, overrides).values():
+            visit(dependency, None)
+        visiting.remove(current)
+        order.append(current)
+
+    visit(cast("AnyFactory", factory), overrides)
+    return order
+
+
+class _Rows:
+    def __init__(self) -> None:
+        self.columns: tuple[str, ...] = ()
+        self.rows: list[tuple[object, ...]] = []
+
+
+def _collect(
+    factory: AnyFactory,
+    header: tuple[str, ...],
+    values: list[tuple[object, ...]],
+    foreign_keys: Mapping[str, AnyFactory],
+    primary_key: str,
+    rows: dict[AnyFactory, _Rows],
+    seen: dict[AnyFactory, set[object]],
+) -> None:
+    for key, dependency in foreign_keys.items():
+        index = header.index(key)
+        instances = [row[index] for row in values]
+        keys = [getattr(instance, primary_key) for instance in instances]
+        seen_keys = seen[dependency]
+        new_instances = []
+        for instance, value in zip(instances, keys, strict=True):
+            if value not in seen_keys:
+                seen_keys.add(value)
+                new_instances.append(instance)
+
+        dependency_header = dependency.get_header()
+        dependency_values = [
+            tuple(getattr(instance, name) for name in dependency_header)
+            for instance in new_instances
+        ]
+        _collect(
+            dependency,
+            dependency_header,
+            dependency_values,
+            get_foreign_keys(dependency),
+            primary_key,
+            rows,
+            seen,
+        )
+        values = [
+            (*row[:index], value, *row[index + 1 :])
+            for row, value in zip(values, keys, strict=True)
+        ]
+
+    table_rows = rows[factory]
+    table_rows.columns = header
+    table_rows.rows.extend(values)
+
+
+def _write(
+    cursor: Cursor,
+    table: str,
+    columns: tuple[str, ...],
+    rows: list[tuple[object, ...]],
+    placeholder: str,
+) -> None:
+    names = ", ".join(columns)
+    copy = getattr(cursor, "copy", None)
+    if copy is not None:
+        with copy(f"COPY {table} ({names}) FROM STDIN") as stream:
+            for row in rows:
+                stream.write_row(row)
+        return
+
+    placeholders = ", ".join([placeholder] * len(columns))
+    operation = f"INSERT INTO {table} ({names}) VALUES ({placeholders})"  # noqa: S608
+    cursor.executemany(operation, rows)
+
+
+def insert(
+    connection: Connection,
+    factory: type[Factory[T]],
+    n: int,
+    *,
+    primary_key: str = "id",
+    placeholder: str = "?",
+    tables: Mapping[type, str] | None = None,
+    chunk_size: int = 1000,
+    **kwargs: object,
+) -> None:
+    order = dependency_order(factory, kwargs)
+    root = order[-1]
+    table_names = {}
+    for dependency in order:
+        model = dependency.get_model()
+        table_names[dependency] = (tables or {}).get(model) or get_table(model)
+    foreign_keys = get_foreign_keys(root, kwargs)
+    header = root.get_header(kwargs)
+    seen: dict[AnyFactory, set[object]] = {dependency: set() for dependency in order}
+    cursor = connection.cursor()
+    try:
+        for size in _chunk_sizes(n, chunk_size):
+            rows = {dependency: _Rows() for dependency in order}
+            values = root.build_raw_batch(size, **kwargs)
+            _collect(root, header, values, foreign_keys, primary_key, rows, seen)
+            for dependency in order:
+                table_rows = rows[dependency]
+                if table_rows.rows:
+                    _write(
+                        cursor,
+                        table_names[dependency],
+                        table_rows.columns,
+                        table_rows.rows,
+                        placeholder,
+                    )
+    finally:
+        cursor.close()
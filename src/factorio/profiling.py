@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from time import perf_counter
+from typing import TYPE_CHECKING, TypeVar, cast
+
+from factorio.fields import AbstractField
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+T = TypeVar("T")
+
+
+@dataclass
+class Timing:
+    calls: int = 0
+    seconds: float = 0.0
+
+
+class TimedField(AbstractField[T]):
+    __slots__ = ("dependencies", "field", "timing")
+
+    def __init__(self, field: AbstractField[T], timing: Timing) -> None:
+        self.field = field
+        self.timing = timing
+        self.dependencies = field.dependencies
+
+    def __call__(self) -> T:
+        start = perf_counter()
+        try:
+            return self.field()
+        finally:
+            self.timing.calls += 1
+            self.timing.seconds += perf_counter() - start
+
+    def batch(self, n: int) -> list[T]:
+        start = perf_counter()
+        try:
+            return self.field.batch(n)
+        finally:
+            self.timing.calls += n
+            self.timing.seconds += perf_counter() - start
+
+    def resolve(self, *values: object) -> T:
+        start = perf_counter()
+        try:
+            return self.field.resolve(*values)
+        finally:
+            self.timing.calls += 1
+            self.timing.seconds += perf_counter() - start
+
+    def resolve_batch(self, n: int, *columns: list[object]) -> list[T]:
+        start = perf_counter()
+        try:
+            return self.field.resolve_batch(n, *columns)
+        finally:
+            self.timing.calls += n
+            self.timing.seconds += perf_counter() - start
+
+    def reset(self) -> None:
+        self.field.reset()
+
+    def is_stateful(self) -> bool:
+        return self.field.is_stateful()
+
+
+class Profile:
+    def __init__(self) -> None:
+        self.timings: dict[str, Timing] = {}
+        self._fields: dict[str, TimedField[object]] = {}
+
+    def timing(self, name: str) -> Timing:
+        timing = self.timings.get(name)
+        if timing is None:
+            timing = self.timings[name] = Timing()
+        return timing
+
+    @contextmanager
+    def timer(self, name: str, calls: int = 1) -> Iterator[Timing]:
+        timing = self.timing(name)
+        start = perf_counter()
+        try:
+            yield timing
+        finally:
+            timing.calls += calls
+            timing.seconds += perf_counter() - start
+
+    def wrap(self, name: str, field: AbstractField[T]) -> TimedField[T]:
+        cached = self._fields.get(name)
+        if cached is not None and cached.field is field:
+            return cast("TimedField[T]", cached)
+        timed = TimedField(field, self.timing(name))
+        self._fields[name] = cast("TimedField[object]", timed)
+        return timed
+
+    def counters(self) -> dict[str, Timing]:
+        return {name: Timing(t.calls, t.seconds) for name, t in self.timings.items()}
+
+    def report(self) -> str:
+        width = max((len(name) for name in self.timings), default=4)
+        lines = [
+            f"{'name':<{width}} {'calls':>10} {'total ms':>12} {'per call µs':>12}"
+        ]
+        for name, timing in sorted(
+            self.timings.items(), key=lambda item: item[1].seconds, reverse=True
+        ):
+            per_call = timing.seconds / timing.calls * 1_000_000 if timing.calls else 0
+            lines.append(
+                f"{name:<{width}} {timing.calls:>10} "
+                f"{timing.seconds * 1000:>12.3f} {per_call:>12.3f}"
+            )
+        return "\n".join(lines)
+
+
+_profile: ContextVar[Profile | None] = ContextVar("factorio_profile", default=None)
+
+
+def get_profile() -> Profile | None:
+    return _profile.get()
+
+
+@contextmanager
+def profile() -> Iterator[Profile]:
+    active = Profile()
+    token = _profile.set(active)
+    try:
+        yield active
+    finally:
+        _profile.reset(token)
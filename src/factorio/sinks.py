@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import csv
+import json
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from functools import partial
+from typing import IO, TYPE_CHECKING, Literal, TypeVar
+from zoneinfo import ZoneInfo
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, Callable, Iterable
+    from os import PathLike
+
+    Writer = Callable[[IO[str], "Header", "Rows"], None]
+    HeaderWriter = Callable[[IO[str], "Header"], None]
+
+T = TypeVar("T")
+Format = Literal["csv", "jsonl", "columnar"]
+Header = tuple[str, ...]
+Rows = list[tuple[object, ...]]
+Columns = dict[str, list[object]]
+BUFFER_SIZE = 1 << 20
+_PLAIN_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def encode(value: object) -> object:
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if isinstance(value, ZoneInfo):
+        return value.key
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if is_dataclass(value) and not isinstance(value, type):
+        return {field.name: getattr(value, field.name) for field in fields(value)}
+    return str(value)
+
+
+_dumps = partial(json.dumps, default=encode, ensure_ascii=False)
+
+
+def _csv_value(value: object) -> object:
+    if type(value) in _PLAIN_TYPES:
+        return value
+    if isinstance(value, (list, tuple, dict)):
+        return _dumps(value)
+    encoded = encode(value)
+    return encoded if type(encoded) in _PLAIN_TYPES else _dumps(encoded)
+
+
+def _write_csv_header(handle: IO[str], header: Header) -> None:
+    csv.writer(handle).writerow(header)
+
+
+def _write_csv(handle: IO[str], header: Header, rows: Rows) -> None:  # noqa: ARG001
+    csv.writer(handle).writerows([_csv_value(value) for value in row] for row in rows)
+
+
+def _write_jsonl(handle: IO[str], header: Header, rows: Rows) -> None:
+    handle.writelines(
+        _dumps(dict(zip(header, row, strict=True))) + "\n" for row in rows
+    )
+
+
+def _write_columnar(handle: IO[str], columns: Columns) -> None:
+    handle.write(_dumps(columns) + "\n")
+
+
+_WRITERS: dict[str, Writer] = {"csv": _write_csv, "jsonl": _write_jsonl}
+_HEADERS: dict[str, HeaderWriter] = {"csv": _write_csv_header}
+
+
+def _get_writers(format: Format) -> tuple[Writer, HeaderWriter | None]:  # noqa: A002
+    try:
+        writer = _WRITERS[format]
+    except KeyError:
+        msg = f"Unknown format: {format}"
+        raise ValueError(msg) from None
+    return writer, _HEADERS.get(format)
+
+
+def _open(path: str | PathLike[str], format: Format) -> IO[str]:  # noqa: A002
+    newline = "" if format == "csv" else None
+    return open(  # noqa: PTH123
+        path, "w", buffering=BUFFER_SIZE, encoding="utf-8", newline=newline
+    )
+
+
+def write(
+    path: str | PathLike[str],
+    header: Header,
+    chunks: Iterable[Rows],
+    format: Format,  # noqa: A002
+) -> None:
+    writer, write_header = _get_writers(format)
+    with _open(path, format) as handle:
+        if write_header is not None:
+            write_header(handle, header)
+        for rows in chunks:
+            writer(handle, header, rows)
+
+
+def write_columns(path: str | PathLike[str], chunks: Iterable[Columns]) -> None:
+    with _open(path, "columnar") as handle:
+        for columns in chunks:
+            _write_columnar(handle, columns)
+
+
+async def _drain(chunks: AsyncIterable[T], writer: Callable[[T], None]) -> None:
+    import asyncio  # noqa: PLC0415
+
+    pending: asyncio.Future[None] | None = None
+    try:
+        async for chunk in chunks:
+            if pending is not None:
+                await pending
+            pending = asyncio.ensure_future(asyncio.to_thread(writer, chunk))
+    finally:
+        if pending is not None:
+            await pending
+
+
+async def awrite(
+    path: str | PathLike[str],
+    header: Header,
+    chunks: AsyncIterable[Rows],
+    format: Format,  # noqa: A002
+) -> None:
+    writer, write_header = _get_writers(format)
+    with _open(path, format) as handle:
+        if write_header is not None:
+            write_header(handle, header)
+        await _drain(chunks, partial(writer, handle, header))
+
+
+async def awrite_columns(
+    path: str | PathLike[str], chunks: AsyncIterable[Columns]
+) -> None:
+    with _open(path, "columnar") as handle:
+        await _drain(chunks, partial(_write_columnar, handle))
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import Context
+from dataclasses import dataclass
+from random import Random
+
+import pytest
+
+import factorio
+from factorio import fields
+from factorio.backends import RandomBackend, get_backend, use_backend
+from factorio.factories import Factory
+
+
+@dataclass
+class Spam:
+    a: int
+    b: str
+    c: float
+    d: str
+
+
+class SpamFactory(Factory[Spam]):
+    a = fields.IntegerField()
+    b = fields.ChoiceField("abcdefghij")
+    c = fields.FloatField()
+    d = fields.TextField("name")
+
+
+def test_seed_is_reproducible() -> None:
+    factorio.seed(42)
+    first = [SpamFactory.build() for _ in range(5)] + SpamFactory.build_batch(5)
+    factorio.seed(42)
+    second = [SpamFactory.build() for _ in range(5)] + SpamFactory.build_batch(5)
+    assert first == second
+
+
+def test_backend_uses_given_random() -> None:
+    random = Random(1)  # noqa: S311
+    backend = RandomBackend(random=random)
+    assert backend.random is random
+    assert backend.faker.random is random
+
+
+def test_backend_seed() -> None:
+    backend = RandomBackend(seed=7)
+    first = backend.random.random()
+    backend.seed(7)
+    assert backend.random.random() == first
+
+
+def test_use_backend() -> None:
+    default = get_backend()
+    backend = RandomBackend()
+    with use_backend(backend) as active:
+        assert active is backend
+        assert get_backend() is backend
+    assert get_backend() is default
+
+
+def test_factory_backend() -> None:
+    backend = RandomBackend(seed=3)
+
+    class SeededSpamFactory(SpamFactory):
+        random_backend = backend
+        a = fields.IntegerField()
+        b = fields.ChoiceField("abcdefghij")
+        c = fields.FloatField()
+        d = fields.TextField("name")
+
+    default = get_backend()
+    first = [SeededSpamFactory.build(), *SeededSpamFactory.build_batch(3)]
+    backend.seed(3)
+    second = [SeededSpamFactory.build(), *SeededSpamFactory.build_batch(3)]
+    assert first == second
+    assert get_backend() is default
+
+
+def test_backend_without_asyncio(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delitem(sys.modules, "asyncio")
+    backend = Context().run(get_backend)
+    assert Context().run(get_backend) is not backend
+    assert get_backend() is get_backend()
+
+
+def test_fresh_context_gets_its_own_backend() -> None:
+    default = get_backend()
+    backend = Context().run(get_backend)
+    assert backend is not default
+    assert get_backend() is default
+
+
+def test_threads_get_their_own_backend() -> None:
+    def build(seed: int) -> tuple[RandomBackend, list[Spam]]:
+        factorio.seed(seed)
+        return get_backend(), [SpamFactory.build() for _ in range(20)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(build, [1, 1, 1, 1]))
+
+    backends = {id(backend) for backend, _ in results}
+    assert len(backends) == 4
+    assert all(spam == results[0][1] for _, spam in results)
+
+
+def test_tasks_get_their_own_backend() -> None:
+    async def build(seed: int) -> list[Spam]:
+        factorio.seed(seed)
+        spam = []
+        for _ in range(10):
+            spam.append(SpamFactory.build())
+            await asyncio.sleep(0)
+        return spam
+
+    async def main() -> list[list[Spam]]:
+        return list(await asyncio.gather(build(5), build(5), build(5)))
+
+    first, *others = asyncio.run(main())
+    assert all(spam == first for spam in others)
+
+
+def test_backend_fork() -> None:
+    backend = RandomBackend(seed=7)
+    first = backend.fork()
+    backend.seed(7)
+    second = backend.fork()
+    assert first is not backend
+    assert first.random.random() == second.random.random()
+
+
+@pytest.mark.parametrize("draw", [False, True])
+def test_unseeded_tasks_get_their_own_backend(draw: bool) -> None:
+    async def build() -> tuple[RandomBackend, list[Spam]]:
+        backend = get_backend()
+        spam = []
+        for _ in range(5):
+            spam.append(SpamFactory.build())
+            await asyncio.sleep(0)
+        return backend, spam
+
+    async def main() -> list[tuple[RandomBackend, list[Spam]]]:
+        if draw:
+            SpamFactory.build()
+        results = await asyncio.gather(build(), build(), build())
+        thread_backend = await asyncio.to_thread(get_backend)
+        assert thread_backend not in {backend for backend, _ in results}
+        return list(results)
+
+    factorio.seed(42)
+    first = asyncio.run(main())
+    after = SpamFactory.build()
+    factorio.seed(42)
+    second = asyncio.run(main())
+    assert SpamFactory.build() == after
+
+    assert len({id(backend) for backend, _ in first}) == 3
+    assert len({spam[0].a for _, spam in first}) == 3
+    assert [spam for _, spam in first] == [spam for _, spam in second]
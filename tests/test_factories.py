@@ -1,11 +1,31 @@
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from tempfile import gettempdir
 
 import pytest
 
+import factorio
 from factorio import fields
-from factorio.factories import Factory
+from factorio.backends import RandomBackend
+from factorio.factories import BLOCK_SIZE, Factory
+from factorio.profiling import profile
+
+
+@dataclass
+class Ham:
+    a: int
+    b: str
+    c: float
+
+
+class HamFactory(Factory[Ham]):
+    a = fields.IntegerField()
+    b = fields.TextField("name")
+    c = fields.FloatField()
 
 
 def test_get_no_model() -> None:
@@ -73,3 +93,616 @@ def test_new_style_build() -> None:
     )
     assert 99 <= bacon.x <= 101
     assert bacon.t == "Kevin"
+
+
+def test_build_plan_is_cached() -> None:
+    @dataclass
+    class Spam:
+        a: int
+
+    class SpamFactory(Factory[Spam]):
+        a = fields.IntegerField(max_value=42)
+
+    plan = SpamFactory.get_plan()
+    assert plan.model is Spam
+    assert [name for name, _ in plan.fields] == ["a"]
+    assert SpamFactory.get_plan() is plan
+
+
+def test_build_plan_is_invalidated_on_mutation() -> None:
+    @dataclass
+    class Spam:
+        a: int
+        b: int = 0
+
+    class SpamFactory(Factory[Spam]):
+        a = fields.ConstantField(1)
+
+    plan = SpamFactory.get_plan()
+    SpamFactory.b = fields.ConstantField(2)
+    assert SpamFactory.get_plan() is not plan
+    assert SpamFactory.build() == Spam(a=1, b=2)
+
+    del SpamFactory.b  # type: ignore[attr-defined]
+    assert SpamFactory.build() == Spam(a=1, b=0)
+
+
+def test_build_plan_is_per_class() -> None:
+    @dataclass
+    class Spam:
+        a: int = 0
+
+    class SpamFactory(Factory[Spam]):
+        a = fields.ConstantField(1)
+
+    class ChildSpamFactory(SpamFactory):
+        pass
+
+    assert SpamFactory.build() == Spam(a=1)
+    assert ChildSpamFactory.build() == Spam(a=0)
+
+
+def test_build_batch() -> None:
+    @dataclass
+    class Spam:
+        a: int
+        b: str
+        c: int
+        d: str = "Francis"
+
+    class SpamFactory(Factory[Spam]):
+        a = fields.IntegerField(max_value=42)
+        b = fields.StringField(max_chars=4)
+        c = fields.ConstantField(1024)
+
+    spam = SpamFactory.build_batch(50)
+    assert len(spam) == 50
+    assert all(1 <= item.a <= 42 for item in spam)
+    assert all(1 <= len(item.b) <= 4 for item in spam)
+    assert all(item.c == 1024 for item in spam)
+    assert all(item.d == "Francis" for item in spam)
+
+    overridden = SpamFactory.build_batch(
+        5, a=fields.IntegerField(min_value=99, max_value=101), d="Kevin"
+    )
+    assert all(99 <= item.a <= 101 for item in overridden)
+    assert all(item.d == "Kevin" for item in overridden)
+
+    assert SpamFactory.build_batch(0) == []
+
+
+def test_build_batch_without_fields() -> None:
+    @dataclass
+    class Spam:
+        a: int = 0
+
+    class SpamFactory(Factory[Spam]):
+        pass
+
+    assert SpamFactory.build_batch(3) == [Spam(), Spam(), Spam()]
+
+
+def test_iter_build() -> None:
+    @dataclass
+    class Spam:
+        a: int
+        b: str = "Francis"
+
+    class SpamFactory(Factory[Spam]):
+        a = fields.IntegerField(max_value=42)
+
+    spam = list(SpamFactory.iter_build(5, b="Kevin"))
+    assert len(spam) == 5
+    assert all(1 <= item.a <= 42 for item in spam)
+    assert all(item.b == "Kevin" for item in spam)
+
+
+def test_iter_build_is_lazy() -> None:
+    @dataclass
+    class Spam:
+        a: int
+
+    calls = []
+
+    class CountingField(fields.AbstractField[int]):
+        def __init__(self) -> None:
+            pass
+
+        def __call__(self) -> int:
+            calls.append(1)
+            return len(calls)
+
+    class SpamFactory(Factory[Spam]):
+        a = CountingField()
+
+    spam = SpamFactory.iter_build()
+    assert calls == []
+    assert [next(spam).a for _ in range(3)] == [1, 2, 3]
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize(
+    ("n", "chunk_size", "expected"),
+    [(10, 4, [4, 4, 2]), (8, 4, [4, 4]), (3, 5, [3]), (0, 5, [])],
+)
+def test_iter_build_chunks(n: int, chunk_size: int, expected: list[int]) -> None:
+    @dataclass
+    class Spam:
+        a: int
+
+    class SpamFactory(Factory[Spam]):
+        a = fields.IntegerField(max_value=42)
+
+    chunks = list(SpamFactory.iter_build(n, chunk_size=chunk_size))
+    assert [len(chunk) for chunk in chunks] == expected
+    assert all(isinstance(item, Spam) for chunk in chunks for item in chunk)
+
+
+def test_iter_build_unbounded_chunks() -> None:
+    @dataclass
+    class Spam:
+        a: int
+
+    class SpamFactory(Factory[Spam]):
+        a = fields.IntegerField(max_value=42)
+
+    chunks = SpamFactory.iter_build(chunk_size=3)
+    assert [len(next(chunks)) for _ in range(4)] == [3, 3, 3, 3]
+
+
+def test_iter_build_invalid_chunk_size() -> None:
+    class SpamFactory(Factory[int]):
+        pass
+
+    with pytest.raises(ValueError, match="Chunk size"):
+        SpamFactory.iter_build(chunk_size=0)
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_build_batch_workers(workers: int) -> None:
+    n = 2 * BLOCK_SIZE + 10
+    factorio.seed(42)
+    expected = HamFactory.build_batch(n, workers=1, c=1.0)
+    factorio.seed(42)
+    ham = HamFactory.build_batch(n, workers=workers, c=1.0)
+    assert len(ham) == n
+    assert ham == expected
+    assert all(item.c == 1.0 for item in ham)
+
+
+@dataclass
+class Sandwich:
+    ham: Ham
+    hams: list[Ham]
+
+
+class SandwichFactory(Factory[Sandwich]):
+    ham = fields.FactoryField(HamFactory, pool_size=5)
+    hams = fields.ListField(fields.FactoryField(HamFactory), length=2)
+
+
+def test_is_stateful() -> None:
+    assert not HamFactory.is_stateful()
+    assert not HamFactory.is_stateful(a=fields.IntegerField())
+    assert SandwichFactory.is_stateful()
+    assert not SandwichFactory.is_stateful(ham=None)
+    assert SandwichFactory.is_stateful(
+        ham=None, hams=fields.ListField(fields.FactoryField(HamFactory, pool_size=1))
+    )
+
+
+class SeededHamFactory(Factory[Ham]):
+    random_backend = RandomBackend(seed=7)
+    a = fields.IntegerField()
+    b = fields.TextField("name")
+    c = fields.FloatField()
+
+
+class SeededSandwichFactory(Factory[Sandwich]):
+    ham = fields.FactoryField(SeededHamFactory)
+    hams = fields.ListField(fields.FactoryField(HamFactory), length=2)
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_build_batch_workers_seeded_child(workers: int) -> None:
+    assert SeededSandwichFactory.is_stateful()
+    assert not SeededSandwichFactory.is_stateful(ham=None)
+    n = 2 * BLOCK_SIZE + 10
+    factorio.seed(42)
+    SeededHamFactory.random_backend = RandomBackend(seed=7)
+    expected = SeededSandwichFactory.build_batch(n, workers=1)
+    factorio.seed(42)
+    SeededHamFactory.random_backend = RandomBackend(seed=7)
+    assert SeededSandwichFactory.build_batch(n, workers=workers) == expected
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_build_batch_workers_stateful(workers: int) -> None:
+    n = 2 * BLOCK_SIZE + 10
+    factorio.seed(42)
+    SandwichFactory.reset_fields()
+    expected = SandwichFactory.build_batch(n, workers=1)
+    factorio.seed(42)
+    SandwichFactory.reset_fields()
+    sandwiches = SandwichFactory.build_batch(n, workers=workers)
+    assert sandwiches == expected
+    assert len({id(sandwich.ham) for sandwich in sandwiches}) == 5
+
+
+class UniqueHamFactory(Factory[Ham]):
+    a = fields.IntegerField(max_value=3 * BLOCK_SIZE, unique=True)
+    b = fields.TextField("name")
+    c = fields.FloatField()
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_build_batch_workers_unique(workers: int) -> None:
+    UniqueHamFactory.reset_fields()
+    ham = UniqueHamFactory.build_batch(3 * BLOCK_SIZE, workers=workers)
+    assert sorted(item.a for item in ham) == list(range(1, 3 * BLOCK_SIZE + 1))
+
+
+@dataclass
+class Ticket:
+    number: int
+    serial: str
+
+
+class TicketFactory(Factory[Ticket]):
+    number = fields.SequenceField()
+    serial = fields.SharedSequenceField(
+        Path(gettempdir()) / "factorio-tests.sequence", template="T{}"
+    )
+
+
+def test_build_batch_workers_sequences() -> None:
+    assert TicketFactory.is_stateful()
+    assert not TicketFactory.is_stateful(number=0)
+
+    TicketFactory.reset_fields()
+    tickets = TicketFactory.build_batch(3 * BLOCK_SIZE, workers=3)
+    assert [ticket.number for ticket in tickets] == list(range(1, 3 * BLOCK_SIZE + 1))
+    assert len({ticket.serial for ticket in tickets}) == 3 * BLOCK_SIZE
+
+    shared = TicketFactory.build_batch(3 * BLOCK_SIZE, workers=3, number=0)
+    assert len({ticket.serial for ticket in tickets + shared}) == 6 * BLOCK_SIZE
+
+
+def test_build_batch_workers_overrides(tmp_path: Path) -> None:
+    serial = fields.SharedSequenceField(tmp_path / "sequence")
+    hams = HamFactory.build_batch(2 * BLOCK_SIZE, workers=2, a=serial)
+    assert sorted(ham.a for ham in hams) == list(range(1, 2 * BLOCK_SIZE + 1))
+
+    factorio.seed(42)
+    expected = HamFactory.build_batch(10, workers=1, c=fields.LazyField(lambda a: a))
+    factorio.seed(42)
+    hams = HamFactory.build_batch(10, workers=2, c=fields.LazyField(lambda a: a))
+    assert hams == expected
+    assert all(ham.c == ham.a for ham in hams)
+
+
+def test_build_batch_invalid_workers() -> None:
+    with pytest.raises(ValueError, match="workers"):
+        HamFactory.build_batch(10, workers=0)
+
+
+def test_reset_fields() -> None:
+    @dataclass
+    class Spam:
+        a: int
+
+    class SpamFactory(Factory[Spam]):
+        a = fields.IntegerField(min_value=1, max_value=3, unique=True)
+
+    assert sorted(spam.a for spam in SpamFactory.build_batch(3)) == [1, 2, 3]
+    with pytest.raises(ValueError, match="unique values"):
+        SpamFactory.build()
+
+    SpamFactory.reset_fields()
+    assert 1 <= SpamFactory.build().a <= 3
+
+
+def test_build_columns() -> None:
+    class SeededHamFactory(HamFactory):
+        random_backend = RandomBackend(seed=1)
+        a = fields.IntegerField(max_value=42)
+        b = fields.TextField("name")
+
+    columns = SeededHamFactory.build_columns(3, c=1.0)
+    assert list(columns) == ["a", "b", "c"]
+    assert all(1 <= value <= 42 for value in columns["a"])  # type: ignore[operator]
+    assert all(isinstance(value, str) for value in columns["b"])
+    assert columns["c"] == [1.0] * 3
+
+    with profile() as active:
+        SeededHamFactory.build_columns(3)
+    assert active.counters()["SeededHamFactory"].calls == 3
+
+
+def test_build_raw() -> None:
+    class SeededHamFactory(HamFactory):
+        random_backend = RandomBackend(seed=1)
+        a = fields.IntegerField(max_value=42)
+        b = fields.TextField("name")
+        c = fields.FloatField()
+
+    assert SeededHamFactory.get_header() == ("a", "b", "c")
+    assert SeededHamFactory.get_header(["c", "d"]) == ("a", "b", "c", "d")
+
+    a, b, c = SeededHamFactory.build_raw(c=1.0)
+    assert 1 <= a <= 42  # type: ignore[operator]
+    assert isinstance(b, str)
+    assert c == 1.0
+    assert SeededHamFactory.build_raw(d="spam")[3] == "spam"
+
+    with profile() as active:
+        SeededHamFactory.build_raw()
+    assert active.counters()["SeededHamFactory"].calls == 1
+
+
+def test_build_raw_is_reproducible() -> None:
+    class SeededHamFactory(HamFactory):
+        random_backend = RandomBackend(seed=7)
+        a = fields.IntegerField()
+        b = fields.TextField("name")
+        c = fields.FloatField()
+
+    rows = SeededHamFactory.build_raw_batch(5)
+    SeededHamFactory.random_backend = RandomBackend(seed=7)
+    columns = SeededHamFactory.build_columns(5)
+    assert rows == list(zip(*columns.values(), strict=True))
+
+
+def test_build_raw_batch() -> None:
+    rows = HamFactory.build_raw_batch(5, b="Kevin", d=3)
+    assert len(rows) == 5
+    assert all(len(row) == 4 for row in rows)
+    assert all(row[1] == "Kevin" and row[3] == 3 for row in rows)
+    assert HamFactory.build_raw_batch(0) == []
+
+    class EmptyFactory(Factory[Ham]):
+        pass
+
+    assert EmptyFactory.build_raw_batch(2) == [(), ()]
+
+    with profile() as active:
+        HamFactory.build_raw_batch(4)
+    assert active.counters()["HamFactory"].calls == 4
+
+
+class Recorder(fields.AbstractField[int]):
+    def __init__(self, log: list[str]) -> None:
+        self.log = log
+
+    def __call__(self) -> int:
+        return self.batch(1)[0]
+
+    def batch(self, n: int) -> list[int]:
+        self.log.append(f"generate {n}")
+        return list(range(n))
+
+
+def test_abuild() -> None:
+    ham = asyncio.run(HamFactory.abuild(b="Francis"))
+    assert isinstance(ham, Ham)
+    assert ham.b == "Francis"
+
+
+def test_abuild_batch() -> None:
+    hams = asyncio.run(HamFactory.abuild_batch(5, chunk_size=2, b="Kevin"))
+    assert len(hams) == 5
+    assert {ham.b for ham in hams} == {"Kevin"}
+
+
+def test_aiter_build() -> None:
+    async def main() -> tuple[list[Ham], list[list[Ham]]]:
+        items = [ham async for ham in HamFactory.aiter_build(3)]
+        chunks = [chunk async for chunk in HamFactory.aiter_build(5, chunk_size=2)]
+        return items, chunks
+
+    items, chunks = asyncio.run(main())
+    assert len(items) == 3
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+
+def test_aiter_build_interleaves_tasks() -> None:
+    log: list[str] = []
+
+    async def build(name: str) -> None:
+        async for _ in HamFactory.aiter_build(2):
+            log.append(name)  # noqa: PERF401
+
+    async def main() -> None:
+        await asyncio.gather(build("spam"), build("eggs"))
+
+    asyncio.run(main())
+    assert log == ["spam", "eggs", "spam", "eggs"]
+
+
+def test_afeed() -> None:
+    @dataclass
+    class Spam:
+        a: int
+
+    log: list[str] = []
+
+    class SpamFactory(Factory[Spam]):
+        a = Recorder(log)
+
+    async def sink(chunk: list[Spam]) -> None:
+        log.append(f"write {len(chunk)}")
+        await asyncio.sleep(0)
+        log.append("written")
+
+    asyncio.run(SpamFactory.afeed(5, sink, chunk_size=2))
+    assert log == [
+        "generate 2",
+        "generate 2",
+        "write 2",
+        "written",
+        "generate 1",
+        "write 2",
+        "written",
+        "write 1",
+        "written",
+    ]
+
+
+def test_afeed_sink_error() -> None:
+    async def sink(chunk: list[Ham]) -> None:
+        await asyncio.sleep(0)
+        raise ValueError(len(chunk))
+
+    with pytest.raises(ValueError, match="2"):
+        asyncio.run(HamFactory.afeed(5, sink, chunk_size=2))
+
+
+def test_afeed_nothing() -> None:
+    chunks: list[list[Ham]] = []
+
+    async def sink(chunk: list[Ham]) -> None:
+        chunks.append(chunk)
+
+    asyncio.run(HamFactory.afeed(0, sink))
+    assert chunks == []
+
+
+@dataclass
+class Trip:
+    end: date
+    start: date
+    days: int
+
+
+class TripFactory(Factory[Trip]):
+    end = fields.LazyField(lambda start, days: start + timedelta(days=days))
+    start = fields.DateField()
+    days = fields.IntegerField(min_value=1, max_value=10)
+
+
+def test_lazy_plan_order() -> None:
+    assert [key for key, _ in TripFactory.get_plan().fields] == ["start", "days", "end"]
+
+
+def test_lazy_build() -> None:
+    trips = [TripFactory.build(), *TripFactory.build_batch(10)]
+    assert all(trip.end == trip.start + timedelta(days=trip.days) for trip in trips)
+
+
+def test_lazy_build_overrides() -> None:
+    trip = TripFactory.build(start=date(2021, 1, 1), days=fields.ConstantField(2))
+    assert trip.end == date(2021, 1, 3)
+    trips = TripFactory.build_batch(3, days=1)
+    assert all(trip.end == trip.start + timedelta(days=1) for trip in trips)
+
+
+def test_lazy_overrides() -> None:
+    days = fields.LazyField(lambda start: start.day)
+    trips = [TripFactory.build(days=days), *TripFactory.build_batch(5, days=days)]
+    assert all(trip.days == trip.start.day for trip in trips)
+    assert all(trip.end == trip.start + timedelta(days=trip.days) for trip in trips)
+
+    start, days_value, end = TripFactory.build_raw(days=days)
+    assert days_value == start.day  # type: ignore[attr-defined]
+    assert end == start + timedelta(days=days_value)  # type: ignore[arg-type,operator]
+
+    columns = TripFactory.build_columns(
+        5, days=days, extra=fields.LazyField(lambda end, days: (end, days))
+    )
+    assert list(columns) == ["start", "days", "end", "extra"]
+    assert columns["extra"] == list(zip(columns["end"], columns["days"], strict=True))
+
+
+def test_lazy_overrides_errors() -> None:
+    start = fields.LazyField(lambda end: end)
+    with pytest.raises(ValueError, match="Circular dependency found for TripFactory"):
+        TripFactory.build(start=start)
+    with pytest.raises(
+        ValueError, match=r"Unknown dependency spam of TripFactory\.days"
+    ):
+        TripFactory.build_batch(2, days=fields.LazyField(lambda spam: spam), spam=1)
+
+
+def test_overridden_fields_are_not_evaluated() -> None:
+    calls: list[int] = []
+
+    def compute_end(start: date, days: int) -> date:
+        calls.append(days)
+        return start + timedelta(days=days)
+
+    class LoggedTripFactory(Factory[Trip]):
+        end = fields.LazyField(compute_end)
+        start = fields.DateField()
+        days = fields.IntegerField(min_value=1, max_value=10)
+
+    LoggedTripFactory.build(end=date(2021, 1, 1))
+    LoggedTripFactory.build_batch(3, end=date(2021, 1, 1))
+    LoggedTripFactory.build_columns(3, end=date(2021, 1, 1))
+    assert calls == []
+
+
+def test_lazy_build_raw() -> None:
+    for start, days, end in [
+        TripFactory.build_raw(),
+        *TripFactory.build_raw_batch(5),
+    ]:
+        assert end == start + timedelta(days=days)  # type: ignore[arg-type,operator]
+
+
+def test_lazy_build_columns() -> None:
+    columns = TripFactory.build_columns(5, days=2, extra="spam")
+    assert list(columns) == ["start", "days", "end", "extra"]
+    assert columns["end"] == [
+        start + timedelta(days=2)  # type: ignore[operator]
+        for start in columns["start"]
+    ]
+
+
+def test_lazy_chain() -> None:
+    @dataclass
+    class Spam:
+        a: int
+        b: int
+        c: int
+
+    class SpamFactory(Factory[Spam]):
+        c = fields.LazyField(lambda b: b * 2)
+        b = fields.LazyField(lambda a: a + 1)
+        a = fields.IntegerField(max_value=10)
+
+    spam = SpamFactory.build()
+    assert spam.c == (spam.a + 1) * 2
+
+
+def test_lazy_defaults() -> None:
+    @dataclass
+    class Spam:
+        a: int
+        b: str
+
+    class SpamFactory(Factory[Spam]):
+        a = fields.IntegerField(max_value=10)
+        b = fields.LazyField(lambda a, sep="-": f"{a}{sep}")
+
+    spam = SpamFactory.build()
+    assert spam.b == f"{spam.a}-"
+    assert [spam.b for spam in SpamFactory.build_batch(3, a=1)] == ["1-"] * 3
+
+
+def test_lazy_circular_dependency() -> None:
+    class SpamFactory(Factory[Trip]):
+        start = fields.LazyField(lambda end: end)
+        end = fields.LazyField(lambda start: start)
+
+    with pytest.raises(ValueError, match="Circular dependency"):
+        SpamFactory.build()
+
+
+def test_lazy_unknown_dependency() -> None:
+    class SpamFactory(Factory[Trip]):
+        end = fields.LazyField(lambda finish: finish)
+
+    with pytest.raises(
+        ValueError, match=r"Unknown dependency finish of SpamFactory\.end"
+    ):
+        SpamFactory.build()
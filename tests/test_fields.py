@@ -1,15 +1,24 @@
 from __future__ import annotations
 
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
+from itertools import chain, pairwise
 from string import ascii_lowercase, ascii_uppercase, digits
+from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
 import pytest
 
 from factorio import fields
+from factorio.backends import RandomBackend, get_backend, use_backend
 from factorio.factories import Factory
+from factorio.lib.providers import PROVIDERS
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 def test_init_implementation_needed() -> None:
@@ -198,3 +207,797 @@ def test_factory_field() -> None:
 
     factory_field = fields.FactoryField(SpamFactory)
     assert 0 <= factory_field().a <= 42
+
+
+def test_batch_fallback() -> None:
+    class MyField(fields.AbstractField[int]):
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def __call__(self) -> int:
+            self.calls += 1
+            return self.calls
+
+    field = MyField()
+    assert field.batch(3) == [1, 2, 3]
+    assert field.batch(0) == []
+
+
+def test_constant_field_batch() -> None:
+    assert fields.ConstantField(42).batch(3) == [42, 42, 42]
+
+
+def test_choice_field_batch() -> None:
+    values = fields.ChoiceField(range(1, 11)).batch(100)
+    assert len(values) == 100
+    assert all(1 <= value <= 10 for value in values)
+
+
+@pytest.mark.parametrize(("truth_probability", "expected"), [(0, False), (100, True)])
+def test_boolean_field_batch(truth_probability: int, expected: bool) -> None:
+    values = fields.BooleanField(truth_probability=truth_probability).batch(100)
+    assert values == [expected] * 100
+
+
+def test_integer_field_batch() -> None:
+    values = fields.IntegerField(min_value=1, max_value=9, step=2).batch(100)
+    assert len(values) == 100
+    assert set(values) <= {1, 3, 5, 7, 9}
+
+
+def test_float_field_batch() -> None:
+    values = fields.FloatField(min_value=-100, max_value=100).batch(100)
+    assert len(values) == 100
+    assert all(abs(value) <= 100 for value in values)
+
+
+def test_date_field_batch() -> None:
+    start_date = date(2021, 1, 1)
+    end_date = date(2021, 1, 3)
+    values = fields.DateField(min_date=start_date, max_date=end_date).batch(100)
+    assert len(values) == 100
+    assert all(start_date <= value <= end_date for value in values)
+
+
+def test_factory_field_batch() -> None:
+    @dataclass
+    class Spam:
+        a: int
+
+    class SpamFactory(Factory[Spam]):
+        a = fields.IntegerField(max_value=42)
+
+    values = fields.FactoryField(SpamFactory).batch(10)
+    assert len(values) == 10
+    assert all(0 <= value.a <= 42 for value in values)
+
+
+def test_unique_integer_field() -> None:
+    field = fields.IntegerField(min_value=1, max_value=20, step=2, unique=True)
+    values = [field(), *field.batch(8), field()]
+    assert sorted(values) == list(range(1, 21, 2))
+    with pytest.raises(ValueError, match="unique values"):
+        field()
+
+    field.reset()
+    assert sorted(field.batch(10)) == list(range(1, 21, 2))
+
+
+def test_unique_string_field() -> None:
+    field = fields.StringField(min_chars=1, max_chars=1, unique=True)
+    values = field.batch(10)
+    assert len(set(values)) == 10
+    with pytest.raises(ValueError, match="unique value"):
+        field.batch(100)
+
+    field.reset()
+    assert len(set(field.batch(10))) == 10
+
+
+def test_unique_text_field() -> None:
+    field = fields.TextField("am_pm", unique=True)
+    assert {field(), field()} == {"AM", "PM"}
+    with pytest.raises(ValueError, match="unique value"):
+        field()
+
+    field.reset()
+    assert field() in {"AM", "PM"}
+
+
+def test_unique_fields_are_stateful() -> None:
+    assert fields.IntegerField(unique=True).is_stateful()
+    assert fields.StringField(unique=True).is_stateful()
+    assert fields.TextField("name", unique=True).is_stateful()
+    assert not fields.StringField().is_stateful()
+    assert not fields.TextField("name").is_stateful()
+
+
+def test_unique_fields_threads() -> None:
+    integer_field = fields.IntegerField(max_value=2000, unique=True)
+    string_field = fields.StringField(min_chars=3, max_chars=3, unique=True)
+    with ThreadPoolExecutor(4) as executor:
+        integers = list(executor.map(integer_field.batch, [100] * 20))
+        strings = list(executor.map(lambda _: string_field(), range(500)))
+    assert sorted(chain.from_iterable(integers)) == list(range(1, 2001))
+    assert len(set(strings)) == 500
+
+
+def test_reset_without_unique() -> None:
+    for field in (
+        fields.IntegerField(),
+        fields.StringField(),
+        fields.TextField("name"),
+        fields.ConstantField(1),
+    ):
+        field.reset()
+
+
+def test_timezone_field_shares_zones() -> None:
+    first = fields.TimezoneField(("Europe",))
+    second = fields.TimezoneField(("Europe",))
+    assert isinstance(first.valid_zones, tuple)
+    assert first.valid_zones is second.valid_zones
+    assert first.valid_zones is fields.get_zones(("Europe",))
+    keys = [zone.key for zone in first.valid_zones]
+    assert keys == sorted(keys)
+    assert all(key.startswith("Europe") for key in keys)
+
+
+@pytest.mark.parametrize(
+    "field",
+    [
+        fields.ConstantField(1),
+        fields.ChoiceField("ab"),
+        fields.IntegerField(unique=True),
+        fields.DecimalField(),
+        fields.StringField(),
+        fields.DateTimeField(),
+        fields.TimezoneField(),
+        fields.TextField("name"),
+        fields.DictField(fields.CharField(), fields.BooleanField()),
+        fields.LazyField(lambda a: a),
+        fields.SequenceField(),
+    ],
+)
+def test_fields_are_slotted(field: fields.AbstractField[object]) -> None:
+    assert not hasattr(field, "__dict__")
+    with pytest.raises(AttributeError):
+        field.spam = 1  # type: ignore[attr-defined]
+
+
+def test_choice_field_interns_options() -> None:
+    first = fields.ChoiceField([1, 2, 3])
+    second = fields.ChoiceField(range(1, 4))
+    assert first.options == (1, 2, 3)
+    assert first.options is second.options
+    assert fields.ChoiceField([True, 2.0, 3]).options == (True, 2.0, 3)
+    assert type(fields.ChoiceField([True, 2.0, 3]).options[0]) is bool
+    assert fields.ChoiceField([Decimal(1)]).options[0].as_tuple().exponent == 0
+    assert fields.ChoiceField([Decimal("1.0")]).options[0].as_tuple().exponent == -1
+    assert fields.ChoiceField([[1], [2]]).options == ([1], [2])
+    assert fields.ChoiceField([1.0]).options is not fields.ChoiceField([1.0]).options
+
+
+def test_choice_field_shared_options_are_bounded() -> None:
+    options = fields.ChoiceField(["spam", "eggs"]).options
+    for index in range(fields.SHARED_TABLES):
+        fields.ChoiceField(["spam", index])
+    assert fields.ChoiceField(["spam", "eggs"]).options is not options
+
+
+@pytest.mark.parametrize("text_type", ["spam", "random", "locales", "seed", "_get"])
+def test_text_field_invalid_type(text_type: str) -> None:
+    with pytest.raises(ValueError, match=f"Unknown text type: {text_type}"):
+        fields.TextField(text_type)
+
+
+def test_text_field_known_providers() -> None:
+    faker = RandomBackend().faker
+    assert all(callable(getattr(faker, name)) for name in PROVIDERS)
+
+
+def test_text_field_custom_provider() -> None:
+    from faker.providers import BaseProvider  # noqa: PLC0415
+
+    class SpamProvider(BaseProvider):
+        def spam(self) -> str:
+            return "spam"
+
+    backend = RandomBackend()
+    backend.faker.add_provider(SpamProvider)
+    with use_backend(backend):
+        text_field = fields.TextField("spam")
+        assert text_field() == "spam"
+    with pytest.raises(ValueError, match="Unknown text type: spam"):
+        text_field()
+
+
+def test_text_field_relaxed_type() -> None:
+    assert fields.TextField("Color-Name").provider == "color_name"
+    assert fields.TextField("first name").provider == "first_name"
+
+
+def test_text_field_kwargs() -> None:
+    text_field = fields.TextField("bothify", text="spam-##")
+    value = text_field()
+    assert value.startswith("spam-")
+    assert value[5:].isdigit()
+
+
+def test_text_field_follows_backend() -> None:
+    text_field = fields.TextField("name")
+    with use_backend(RandomBackend(seed=1)):
+        first = text_field.batch(5)
+    with use_backend(RandomBackend(seed=1)):
+        second = text_field.batch(5)
+    assert first == second
+
+
+def test_text_field_threads() -> None:
+    text_field = fields.TextField("name")
+    text_field()
+    bound = text_field._bound[get_backend()]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        names = list(executor.map(lambda _: text_field.batch(50), range(8)))
+    assert all(isinstance(name, str) for name in chain.from_iterable(names))
+    assert text_field._bound[get_backend()] is bound
+
+
+@dataclass(frozen=True)
+class Egg:
+    id: int
+
+
+class EggFactory(Factory[Egg]):
+    id = fields.IntegerField(max_value=10**6, unique=True)
+
+
+def test_factory_field_pool() -> None:
+    factory_field = fields.FactoryField(EggFactory, pool_size=3)
+    values = [factory_field() for _ in range(7)]
+    assert len(set(values)) == 3
+    assert values[:3] == values[3:6]
+    assert values[6] == values[0]
+    assert factory_field.batch(5) == [*values[1:3], *values[:3]]
+    assert factory_field.batch(1) == [values[0]]
+
+
+def test_factory_field_pool_batch() -> None:
+    factory_field = fields.FactoryField(EggFactory, pool_size=3)
+    values = factory_field.batch(8)
+    assert values == [*values[:3], *values[:3], *values[:2]]
+    assert len(set(values)) == 3
+
+
+def test_factory_field_pool_random() -> None:
+    factory_field = fields.FactoryField(EggFactory, pool_size=3, reuse="random")
+    values = [factory_field() for _ in range(10)] + factory_field.batch(100)
+    assert set(values) == set(factory_field.pool)
+    assert len(set(values)) == 3
+
+
+def test_factory_field_pool_refresh() -> None:
+    factory_field = fields.FactoryField(EggFactory, pool_size=2, refresh=2)
+    values = factory_field.batch(6)
+    assert values[:2] == values[2:4]
+    assert not set(values[:2]) & set(values[4:])
+    assert len(set(values)) == 4
+
+
+def test_factory_field_pool_random_refresh() -> None:
+    factory_field = fields.FactoryField(
+        EggFactory, pool_size=2, reuse="random", refresh=1
+    )
+    values = factory_field.batch(6)
+    assert len(set(values)) == 6
+
+
+def test_factory_field_pool_reset() -> None:
+    factory_field = fields.FactoryField(EggFactory, pool_size=2)
+    first = factory_field.batch(2)
+    factory_field.reset()
+    assert not set(first) & set(factory_field.batch(2))
+
+
+def test_factory_field_pool_invalid() -> None:
+    with pytest.raises(ValueError, match="Pool size must be positive"):
+        fields.FactoryField(EggFactory, pool_size=0)
+    with pytest.raises(ValueError, match="Refresh must be positive"):
+        fields.FactoryField(EggFactory, pool_size=1, refresh=0)
+    with pytest.raises(ValueError, match="Unknown reuse policy"):
+        fields.FactoryField(EggFactory, pool_size=1, reuse="lifo")  # type: ignore[arg-type]
+
+
+@dataclass(frozen=True)
+class Currency:
+    code: int
+    serial: int
+
+
+class CurrencyFactory(Factory[Currency]):
+    code = fields.IntegerField(max_value=4)
+    serial = fields.IntegerField(max_value=10**6, unique=True)
+
+
+def test_is_stateful() -> None:
+    @dataclass
+    class Spam:
+        a: int
+
+    class SpamFactory(Factory[Spam]):
+        a = fields.IntegerField()
+
+    stateless = fields.IntegerField()
+    pooled = fields.FactoryField(SpamFactory, pool_size=2)
+    assert not stateless.is_stateful()
+    assert not fields.FactoryField(SpamFactory).is_stateful()
+    assert pooled.is_stateful()
+    assert fields.FactoryField(CurrencyFactory, cache=2, key="code").is_stateful()
+    assert not fields.ListField(stateless).is_stateful()
+    assert not fields.TupleField(stateless).is_stateful()
+    assert not fields.SetField(stateless).is_stateful()
+    assert not fields.DictField(stateless, stateless).is_stateful()
+    assert fields.ListField(pooled).is_stateful()
+    assert fields.TupleField(pooled).is_stateful()
+    assert fields.SetField(pooled).is_stateful()
+    assert fields.DictField(stateless, pooled).is_stateful()
+    assert fields.DictField(pooled, stateless).is_stateful()
+
+
+def test_factory_field_cache() -> None:
+    factory_field = fields.FactoryField(CurrencyFactory, cache=10, key="code")
+    values = factory_field.batch(100) + [factory_field() for _ in range(10)]
+    assert {value.code: value for value in values} == {
+        value.code: value for value in reversed(values)
+    }
+    info = factory_field.cache_info()
+    assert info == fields.CacheInfo(110 - info.misses, info.misses, 10, info.misses)
+    assert info.misses == len(set(values)) <= 5
+
+
+def test_factory_field_cache_lazy_key() -> None:
+    @dataclass
+    class Spam:
+        a: int
+        b: int
+
+    class SpamFactory(Factory[Spam]):
+        a = fields.IntegerField()
+        b = fields.LazyField(lambda a: a + 1)
+
+    with pytest.raises(ValueError, match="Cache key b can't depend on other fields"):
+        fields.FactoryField(SpamFactory, cache=10, key="b")
+    assert fields.FactoryField(SpamFactory, cache=10, key="a")().b > 1
+
+
+def test_factory_field_cache_threads() -> None:
+    factory_field = fields.FactoryField(CurrencyFactory, cache=10, key="code")
+    with ThreadPoolExecutor(8) as executor:
+        chunks = list(executor.map(factory_field.batch, [50] * 40))
+    values = list(chain.from_iterable(chunks))
+    assert len({id(value) for value in values}) == 4
+    info = factory_field.cache_info()
+    assert info.hits + info.misses == 2000
+    assert info.currsize == 4
+
+
+def test_factory_field_cache_eviction() -> None:
+    factory_field = fields.FactoryField(CurrencyFactory, cache=1, key="code")
+    values = factory_field.batch(100)
+    for previous, value in pairwise(values):
+        assert (previous == value) is (previous.code == value.code)
+    info = factory_field.cache_info()
+    assert info.currsize == 1
+    assert info.misses == len(set(values))
+
+
+def test_factory_field_cache_scope() -> None:
+    factory_field = fields.FactoryField(CurrencyFactory, cache=10, key="code")
+    outside = factory_field.batch(100)
+    with fields.cache_scope():
+        assert factory_field.cache_info() == fields.CacheInfo(0, 0, 10, 0)
+        inside = factory_field.batch(100)
+        assert factory_field.cache_info().hits == 100 - len(set(inside))
+    assert not set(outside) & set(inside)
+    assert factory_field.cache_info().hits == 100 - len(set(outside))
+
+
+def test_factory_field_cache_reset() -> None:
+    factory_field = fields.FactoryField(CurrencyFactory, cache=10, key="code")
+    factory_field.batch(10)
+    factory_field.reset()
+    assert factory_field.cache_info() == fields.CacheInfo(0, 0, 10, 0)
+
+
+def test_factory_field_cache_invalid() -> None:
+    with pytest.raises(ValueError, match="both a pool and a cache"):
+        fields.FactoryField(CurrencyFactory, pool_size=1, cache=1, key="code")
+    with pytest.raises(ValueError, match="Cache size must be positive"):
+        fields.FactoryField(CurrencyFactory, cache=0, key="code")
+    with pytest.raises(ValueError, match="must be given together"):
+        fields.FactoryField(CurrencyFactory, cache=1)
+    with pytest.raises(ValueError, match="Unknown cache key: name"):
+        fields.FactoryField(CurrencyFactory, cache=1, key="name")
+    with pytest.raises(ValueError, match="no cache"):
+        fields.FactoryField(CurrencyFactory).cache_info()
+
+
+def test_list_field_batch() -> None:
+    list_field = fields.ListField(fields.ConstantField(1), length=3, variation=2)
+    values = list_field.batch(100)
+    assert len(values) == 100
+    assert {len(value) for value in values} <= {1, 2, 3, 4, 5}
+    assert all(set(value) == {1} for value in values)
+
+
+def test_list_field_batches_elements() -> None:
+    list_field = fields.ListField(fields.FactoryField(EggFactory), length=4)
+    values = list_field.batch(5)
+    assert [len(value) for value in values] == [4] * 5
+    assert len({egg for value in values for egg in value}) == 20
+
+
+def test_tuple_field_batch() -> None:
+    tuple_field = fields.TupleField(fields.ConstantField(1), length=2, variation=1)
+    values = tuple_field.batch(100)
+    assert len(values) == 100
+    assert set(values) <= {(1,), (1, 1), (1, 1, 1)}
+
+
+def test_set_field_batch() -> None:
+    set_field = fields.SetField(fields.IntegerField(max_value=2), length=5)
+    values = set_field.batch(100)
+    assert len(values) == 100
+    assert all(value <= {0, 1, 2} for value in values)
+
+
+def test_set_field_exact() -> None:
+    with use_backend(RandomBackend(seed=3)):
+        reference = fields.SetField(fields.SequenceField(), length=5, variation=2)
+        lengths = [len(value) for value in reference.batch(100)]
+    set_field = fields.SetField(
+        fields.IntegerField(max_value=9), length=5, variation=2, exact=True
+    )
+    with use_backend(RandomBackend(seed=3)):
+        values = set_field.batch(100)
+    assert [len(value) for value in values] == lengths
+    assert set(lengths) == {3, 4, 5, 6, 7}
+    assert all(value <= set(range(1, 10)) for value in values)
+    assert 3 <= len(set_field()) <= 7
+
+
+def test_set_field_exact_fixed_length() -> None:
+    set_field = fields.SetField(fields.IntegerField(max_value=3), length=3, exact=True)
+    values = [*set_field.batch(100), set_field()]
+    assert all(value == {1, 2, 3} for value in values)
+
+
+def test_set_field_exact_impossible() -> None:
+    set_field = fields.SetField(fields.IntegerField(max_value=2), exact=True)
+    with pytest.raises(ValueError, match="Only 2 of 5 distinct values"):
+        set_field()
+
+
+def test_dict_field_batch() -> None:
+    dict_field = fields.DictField(
+        fields.IntegerField(max_value=2), fields.ConstantField("spam"), length=5
+    )
+    values = dict_field.batch(100)
+    assert len(values) == 100
+    assert all(set(value) <= {0, 1, 2} for value in values)
+    assert all(set(value.values()) == {"spam"} for value in values)
+
+
+def test_dict_field_exact() -> None:
+    with use_backend(RandomBackend(seed=3)):
+        reference = fields.DictField(
+            fields.SequenceField(), fields.ConstantField(0), length=5, variation=2
+        )
+        lengths = [len(value) for value in reference.batch(100)]
+    dict_field = fields.DictField(
+        fields.IntegerField(max_value=9),
+        fields.IntegerField(min_value=10, max_value=20),
+        length=5,
+        variation=2,
+        exact=True,
+    )
+    with use_backend(RandomBackend(seed=3)):
+        values = dict_field.batch(100)
+    assert [len(value) for value in values] == lengths
+    assert set(lengths) == {3, 4, 5, 6, 7}
+    assert all(set(value) <= set(range(1, 10)) for value in values)
+    assert all(10 <= item <= 20 for value in values for item in value.values())
+
+
+def test_dict_field_exact_fixed_length() -> None:
+    dict_field = fields.DictField(
+        fields.IntegerField(max_value=3),
+        fields.ConstantField("spam"),
+        length=3,
+        exact=True,
+    )
+    values = [*dict_field.batch(100), dict_field()]
+    assert all(value == dict.fromkeys((1, 2, 3), "spam") for value in values)
+
+
+def test_dict_field_exact_impossible() -> None:
+    dict_field = fields.DictField(
+        fields.ConstantField("spam"), fields.ConstantField(0), length=2, exact=True
+    )
+    with pytest.raises(ValueError, match="Only 1 of 2 distinct values"):
+        dict_field()
+
+
+def test_char_field_batch() -> None:
+    values = fields.CharField(include_digits=True).batch(10_000)
+    assert len(values) == 10_000
+    assert set(values) == set(ascii_lowercase + digits)
+
+
+def test_string_field_batch() -> None:
+    string_field = fields.StringField(
+        min_chars=2, max_chars=4, prefix="spam-", suffix="-eggs"
+    )
+    values = string_field.batch(1000)
+    assert len(values) == 1000
+    assert {len(value) for value in values} == {12, 13, 14}
+    assert all(value.startswith("spam-") for value in values)
+    assert all(value.endswith("-eggs") for value in values)
+    assert set("".join(value[5:-5] for value in values)) == set(
+        ascii_lowercase + ascii_uppercase
+    )
+
+
+def test_string_field_batch_is_seeded() -> None:
+    string_field = fields.StringField()
+    with use_backend(RandomBackend(seed=1)):
+        first = string_field.batch(10)
+    with use_backend(RandomBackend(seed=1)):
+        second = string_field.batch(10)
+    assert first == second
+
+
+def test_unique_string_field_batch() -> None:
+    string_field = fields.StringField(max_chars=2, unique=True)
+    values = string_field.batch(100)
+    assert len(set(values)) == 100
+
+
+def test_datetime_field_batch() -> None:
+    london_tz = ZoneInfo("Europe/London")
+    start_datetime = datetime(2021, 3, 28, 0, 59, 59, tzinfo=london_tz)
+    end_datetime = datetime(2021, 3, 28, 2, 0, 1, tzinfo=london_tz)
+    datetime_field = fields.DateTimeField(
+        min_datetime=start_datetime, max_datetime=end_datetime
+    )
+    values = datetime_field.batch(1000)
+    assert len(values) == 1000
+    assert all(start_datetime <= value <= end_datetime for value in values)
+    assert {value.tzinfo for value in values} == {london_tz}
+
+
+def test_datetime_field_without_timezone() -> None:
+    start_datetime = datetime(2021, 1, 1)  # noqa: DTZ001
+    end_datetime = datetime(2021, 1, 2)  # noqa: DTZ001
+    datetime_field = fields.DateTimeField(
+        min_datetime=start_datetime, max_datetime=end_datetime
+    )
+    values = [datetime_field(), *datetime_field.batch(100)]
+    assert all(value.tzinfo is None for value in values)
+    assert all(start_datetime <= value <= end_datetime for value in values)
+
+
+def test_datetime_field_wide_range() -> None:
+    datetime_field = fields.DateTimeField(
+        min_datetime=datetime(1, 1, 2, tzinfo=fields.UTC),
+        max_datetime=datetime(9999, 12, 30, tzinfo=fields.UTC),
+    )
+    values = datetime_field.batch(100)
+    assert len(values) == 100
+    assert len({value.microsecond for value in values}) > 50
+
+
+def test_naive_datetime_field_batch() -> None:
+    start_datetime = datetime(2021, 1, 1, 1, 0, 15, 100)  # noqa: DTZ001
+    end_datetime = datetime(2021, 1, 1, 1, 0, 15, 200)  # noqa: DTZ001
+    datetime_field = fields.NaiveDateTimeField(
+        min_datetime=start_datetime, max_datetime=end_datetime
+    )
+    values = datetime_field.batch(1000)
+    assert {value.microsecond for value in values} == set(range(100, 201))
+    assert all(value.tzinfo is None for value in values)
+
+
+def test_timedelta_field_batch() -> None:
+    timedelta_field = fields.TimedeltaField(
+        min_timedelta=timedelta(seconds=1),
+        max_timedelta=timedelta(seconds=1, microseconds=10),
+    )
+    values = timedelta_field.batch(1000)
+    assert {value.microseconds for value in values} == set(range(11))
+    assert {value.seconds for value in values} == {1}
+
+
+def test_time_field_batch() -> None:
+    time_field = fields.TimeField(
+        min_time=time(23, 59, 59, 999990), max_time=time(23, 59, 59, 999999)
+    )
+    values = time_field.batch(1000)
+    assert {value.microsecond for value in values} == set(range(999990, 1000000))
+    assert {value.replace(microsecond=0) for value in values} == {time(23, 59, 59)}
+
+
+def test_decimal_field_batch() -> None:
+    decimal_field = fields.DecimalField(
+        min_value=Decimal("-0.05"), max_value=Decimal("0.05"), accuracy=2
+    )
+    values = decimal_field.batch(1000)
+    assert {value.as_tuple().exponent for value in values} == {-2}
+    assert set(values) == {Decimal(value).scaleb(-2) for value in range(-5, 6)}
+
+
+def test_decimal_field_variation() -> None:
+    decimal_field = fields.DecimalField(
+        min_value=1.5, max_value=Decimal("2.5"), accuracy=1, variation=1
+    )
+    values = [*decimal_field.batch(1000), decimal_field()]
+    assert {value.as_tuple().exponent for value in values} == {0, -1, -2}
+    assert all(Decimal("1.5") <= value <= Decimal("2.5") for value in values)
+    assert {value for value in values if value.as_tuple().exponent == 0} == {Decimal(2)}
+
+
+def test_decimal_field_large_values() -> None:
+    decimal_field = fields.DecimalField(
+        min_value=Decimal(10**40), max_value=Decimal(10**40 + 1), accuracy=10
+    )
+    values = decimal_field.batch(100)
+    assert all(10**40 <= value <= 10**40 + 1 for value in values)
+    assert len(set(values)) > 90
+
+
+def test_decimal_field_float_bounds() -> None:
+    assert set(fields.DecimalField(0.01, 0.02, accuracy=2).batch(200)) == {
+        Decimal("0.01"),
+        Decimal("0.02"),
+    }
+    values = set(fields.DecimalField(0.1, 0.3, accuracy=2).batch(2000))
+    assert values == {Decimal(value) / 100 for value in range(10, 31)}
+    assert fields.DecimalField(9.99, 9.99, accuracy=2)() == Decimal("9.99")
+
+
+def test_decimal_field_empty_range() -> None:
+    with pytest.raises(ValueError, match="No value with 0 decimal places"):
+        fields.DecimalField(
+            min_value=Decimal("0.1"), max_value=Decimal("0.9"), accuracy=0
+        )
+
+
+def test_lazy_field() -> None:
+    lazy_field = fields.LazyField(lambda first, last: f"{first} {last}")
+    assert lazy_field.dependencies == ("first", "last")
+    assert lazy_field.resolve("Francis", "Bacon") == "Francis Bacon"
+    assert lazy_field.resolve_batch(2, ["Francis", "Kevin"], ["Bacon", "Bacon"]) == [
+        "Francis Bacon",
+        "Kevin Bacon",
+    ]
+
+
+def test_lazy_field_without_dependencies() -> None:
+    lazy_field = fields.LazyField(lambda: "spam")
+    assert lazy_field.dependencies == ()
+    assert lazy_field() == "spam"
+    assert lazy_field.resolve_batch(2) == ["spam", "spam"]
+
+
+def test_lazy_field_defaults() -> None:
+    def join(first: str, last: str, /, sep: str = " ", *, end: str = "") -> str:
+        return f"{first}{sep}{last}{end}"
+
+    lazy_field = fields.LazyField(join)
+    assert lazy_field.dependencies == ("first", "last")
+    assert lazy_field.resolve("Francis", "Bacon") == "Francis Bacon"
+
+
+def test_lazy_field_invalid_parameters() -> None:
+    with pytest.raises(ValueError, match="variadic parameter args"):
+        fields.LazyField(lambda *args: args)
+    with pytest.raises(ValueError, match="variadic parameter kwargs"):
+        fields.LazyField(lambda **kwargs: kwargs)
+    with pytest.raises(ValueError, match="keyword-only parameter last"):
+        fields.LazyField(lambda first, *, last: f"{first} {last}")
+
+
+def test_collection_fields_reject_dependencies() -> None:
+    lazy_field = fields.LazyField(lambda a: a)
+    integer_field = fields.IntegerField()
+    with pytest.raises(ValueError, match="ListField items can't depend"):
+        fields.ListField(lazy_field)
+    with pytest.raises(ValueError, match="TupleField items can't depend"):
+        fields.TupleField(lazy_field)
+    with pytest.raises(ValueError, match="SetField items can't depend"):
+        fields.SetField(lazy_field)
+    with pytest.raises(ValueError, match="DictField items can't depend"):
+        fields.DictField(integer_field, lazy_field)
+    with pytest.raises(ValueError, match="DictField items can't depend"):
+        fields.DictField(lazy_field, integer_field)
+    assert fields.ListField(fields.LazyField(lambda: 1), length=2)() == [1, 1]
+
+
+def test_resolve_fallback() -> None:
+    constant_field = fields.ConstantField(42)
+    assert constant_field.resolve() == 42
+    assert constant_field.resolve_batch(2) == [42, 42]
+
+
+def _draw_shared(path: Path, n: int) -> list[int]:
+    sequence_field = fields.SharedSequenceField(path, block_size=7)
+    return [*sequence_field.batch(n), *(sequence_field() for _ in range(n))]
+
+
+def test_sequence_field() -> None:
+    sequence_field = fields.SequenceField()
+    assert [sequence_field() for _ in range(3)] == [1, 2, 3]
+    assert sequence_field.batch(3) == [4, 5, 6]
+    sequence_field.reset()
+    assert sequence_field() == 1
+
+
+def test_sequence_field_template() -> None:
+    sequence_field = fields.SequenceField(120, template="user-{:06d}")
+    assert sequence_field() == "user-000120"
+    assert sequence_field.batch(2) == ["user-000121", "user-000122"]
+
+
+def test_sequence_field_threads() -> None:
+    sequence_field = fields.SequenceField()
+    with ThreadPoolExecutor(4) as executor:
+        chunks = list(executor.map(sequence_field.batch, [100] * 20))
+    assert sorted(chain.from_iterable(chunks)) == list(range(1, 2001))
+
+
+def test_shared_sequence_field(tmp_path: Path) -> None:
+    path = tmp_path / "sequence"
+    sequence_field = fields.SharedSequenceField(path, 10, block_size=3)
+    assert [sequence_field() for _ in range(2)] == [10, 11]
+    assert path.read_text() == "13"
+    assert sequence_field.batch(5) == [12, 13, 14, 15, 16]
+    assert path.read_text() == "17"
+
+    other_field = fields.SharedSequenceField(path, template="{:03d}")
+    assert other_field() == "017"
+    sequence_field.reset()
+    assert sequence_field() == 1017
+
+
+def test_shared_sequence_field_processes(tmp_path: Path) -> None:
+    path = tmp_path / "sequence"
+    with ProcessPoolExecutor(4) as executor:
+        chunks = list(executor.map(_draw_shared, [path] * 8, range(10, 90, 10)))
+    values = list(chain.from_iterable(chunks))
+    assert len(values) == len(set(values)) == 720
+
+
+def test_shared_sequence_field_after_fork(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    sequence_field = fields.SharedSequenceField(tmp_path / "sequence", block_size=5)
+    assert sequence_field() == 1
+    monkeypatch.setattr("os.getpid", lambda: -1)
+    assert sequence_field() == 6
+    monkeypatch.setattr("os.getpid", lambda: -2)
+    assert sequence_field.batch(2) == [11, 12]
+
+
+def test_shared_sequence_field_pickle(tmp_path: Path) -> None:
+    path = tmp_path / "sequence"
+    sequence_field = fields.SharedSequenceField(path, 5, block_size=3, template="#{}")
+    assert sequence_field() == "#5"
+    copy = pickle.loads(pickle.dumps(sequence_field))  # noqa: S301
+    assert (copy.path, copy.start, copy.block_size) == (path, 5, 3)
+    assert copy() == "#8"
+    assert sequence_field() == "#6"
+
+
+def test_shared_sequence_field_invalid_block_size(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Block size must be positive"):
+        fields.SharedSequenceField(tmp_path / "sequence", block_size=0)
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+LAZY_MODULES = {"faker", "pyutilkit.date_utils", "multiprocessing", "asyncio"}
+
+
+def _imported_modules(code: str) -> set[str]:
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(*sys.modules)"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_import_is_lazy() -> None:
+    modules = _imported_modules("import factorio, factorio.fields, factorio.factories")
+    assert "factorio.factories" in modules
+    assert modules.isdisjoint(LAZY_MODULES)
+
+
+def test_simple_fields_do_not_need_faker() -> None:
+    code = """
+from factorio import fields
+fields.ConstantField(1)()
+fields.ChoiceField(range(3))()
+fields.CharField()()
+fields.TimezoneField()
+fields.TextField("name")
+fields.TextField("first name", unique=True)
+"""
+    assert _imported_modules(code).isdisjoint(LAZY_MODULES)
+
+
+@pytest.mark.parametrize(
+    ("code", "module"),
+    [
+        ("fields.IntegerField()()", "faker"),
+        ("fields.TimezoneField()()", "pyutilkit.date_utils"),
+        ('fields.TextField("name")()', "faker"),
+    ],
+)
+def test_modules_are_imported_on_first_use(code: str, module: str) -> None:
+    assert module in _imported_modules(f"from factorio import fields\n{code}")
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass
+from unittest import mock
+
+import pytest
+
+from factorio import fields
+from factorio.factories import Factory
+from factorio.fields import cache_scope
+from factorio.persistence import dependency_order, get_table, insert
+
+
+@dataclass
+class Country:
+    id: int
+    code: str
+
+
+@dataclass
+class User:
+    id: int
+    name: str
+    country: Country
+
+
+@dataclass
+class Order:
+    id: int
+    user: User
+    total: int
+
+
+@dataclass
+class Route:
+    id: int
+    origin: Country
+    destination: Country
+
+
+class Movie:
+    __tablename__ = "films"
+
+    def __init__(self, id: int) -> None:  # noqa: A002
+        self.id = id
+
+
+class CountryFactory(Factory[Country]):
+    id = fields.IntegerField(max_value=10**9, unique=True)
+    code = fields.CharField()
+
+
+class UserFactory(Factory[User]):
+    id = fields.IntegerField(max_value=10**9, unique=True)
+    name = fields.StringField(max_chars=5)
+    country = fields.FactoryField(CountryFactory)
+
+
+class OrderFactory(Factory[Order]):
+    id = fields.IntegerField(max_value=10**9, unique=True)
+    user = fields.FactoryField(UserFactory)
+    total = fields.IntegerField(max_value=100)
+
+
+class RouteFactory(Factory[Route]):
+    id = fields.IntegerField(max_value=10**9, unique=True)
+    origin = fields.FactoryField(CountryFactory)
+    destination = fields.FactoryField(CountryFactory)
+
+
+class MovieFactory(Factory[Movie]):
+    id = fields.IntegerField(max_value=100)
+
+
+@pytest.fixture
+def connection() -> sqlite3.Connection:
+    connection = sqlite3.connect(":memory:")
+    connection.executescript(
+        """
+        CREATE TABLE country (id INTEGER PRIMARY KEY, code TEXT);
+        CREATE TABLE user (
+            id INTEGER PRIMARY KEY,
+            name TEXT,
+            country INTEGER REFERENCES country (id)
+        );
+        CREATE TABLE "order" (
+            id INTEGER PRIMARY KEY,
+            user INTEGER REFERENCES user (id),
+            total INTEGER
+        );
+        CREATE TABLE route (
+            id INTEGER PRIMARY KEY,
+            origin INTEGER REFERENCES country (id),
+            destination INTEGER REFERENCES country (id)
+        );
+        """
+    )
+    connection.execute("PRAGMA foreign_keys = ON")
+    return connection
+
+
+def test_get_table() -> None:
+    assert get_table(Country) == "country"
+    assert get_table(Movie) == "films"
+
+
+def test_dependency_order() -> None:
+    assert dependency_order(OrderFactory) == [
+        CountryFactory,
+        UserFactory,
+        OrderFactory,
+    ]
+
+
+def test_dependency_order_shared() -> None:
+    assert dependency_order(RouteFactory) == [CountryFactory, RouteFactory]
+
+
+def test_dependency_order_cycle() -> None:
+    class EggsFactory(Factory[Country]):
+        pass
+
+    class SpamFactory(Factory[Country]):
+        eggs = fields.FactoryField(EggsFactory)
+
+    EggsFactory.spam = fields.FactoryField(SpamFactory)
+
+    with pytest.raises(ValueError, match="Circular dependency"):
+        dependency_order(SpamFactory)
+
+
+def test_insert(connection: sqlite3.Connection) -> None:
+    insert(connection, UserFactory, 25, chunk_size=10)
+
+    assert connection.execute("SELECT count(*) FROM user").fetchone() == (25,)
+    assert connection.execute("SELECT count(*) FROM country").fetchone() == (25,)
+    query = "SELECT count(*) FROM user JOIN country ON user.country = country.id"
+    assert connection.execute(query).fetchone() == (25,)
+
+
+def test_insert_nested(connection: sqlite3.Connection) -> None:
+    tables: dict[type, str] = {Order: '"order"'}
+    insert(connection, OrderFactory, 10, tables=tables)
+
+    query = """
+        SELECT count(*) FROM "order"
+        JOIN user ON "order".user = user.id
+        JOIN country ON user.country = country.id
+    """
+    assert connection.execute(query).fetchone() == (10,)
+
+
+def test_insert_shared(connection: sqlite3.Connection) -> None:
+    insert(connection, RouteFactory, 10)
+
+    assert connection.execute("SELECT count(*) FROM country").fetchone() == (20,)
+    query = """
+        SELECT count(*) FROM route
+        JOIN country AS origin ON route.origin = origin.id
+        JOIN country AS destination ON route.destination = destination.id
+    """
+    assert connection.execute(query).fetchone() == (10,)
+
+
+def test_insert_override(connection: sqlite3.Connection) -> None:
+    connection.execute("INSERT INTO country VALUES (1, 'GR')")
+    insert(connection, UserFactory, 5, country=1)
+
+    assert connection.execute("SELECT count(*) FROM country").fetchone() == (1,)
+    query = "SELECT DISTINCT country FROM user"
+    assert connection.execute(query).fetchall() == [(1,)]
+
+
+def test_insert_override_factory(connection: sqlite3.Connection) -> None:
+    class GreekFactory(Factory[Country]):
+        id = fields.IntegerField(max_value=10**9, unique=True)
+        code = fields.ConstantField("GR")
+
+    assert dependency_order(UserFactory, {"country": 1}) == [UserFactory]
+    assert dependency_order(
+        UserFactory, {"country": fields.FactoryField(GreekFactory)}
+    ) == [GreekFactory, UserFactory]
+
+    insert(connection, UserFactory, 5, country=fields.FactoryField(GreekFactory))
+
+    query = "SELECT code FROM user JOIN country ON user.country = country.id"
+    assert connection.execute(query).fetchall() == [("GR",)] * 5
+    assert connection.execute("SELECT count(*) FROM country").fetchone() == (5,)
+
+
+def test_insert_pooled(connection: sqlite3.Connection) -> None:
+    class PooledUserFactory(Factory[User]):
+        id = fields.IntegerField(max_value=10**9, unique=True)
+        name = fields.StringField(max_chars=5)
+        country = fields.FactoryField(CountryFactory, pool_size=3)
+
+    class PooledOrderFactory(Factory[Order]):
+        id = fields.IntegerField(max_value=10**9, unique=True)
+        user = fields.FactoryField(PooledUserFactory, pool_size=4)
+        total = fields.IntegerField(max_value=100)
+
+    tables: dict[type, str] = {Order: '"order"'}
+    insert(connection, PooledOrderFactory, 30, tables=tables, chunk_size=7)
+
+    assert connection.execute('SELECT count(*) FROM "order"').fetchone() == (30,)
+    assert connection.execute("SELECT count(*) FROM user").fetchone() == (4,)
+    assert connection.execute("SELECT count(*) FROM country").fetchone() == (3,)
+    query = """
+        SELECT count(*) FROM "order"
+        JOIN user ON "order".user = user.id
+        JOIN country ON user.country = country.id
+    """
+    assert connection.execute(query).fetchone() == (30,)
+
+
+def test_insert_cached(connection: sqlite3.Connection) -> None:
+    class CachedRouteFactory(Factory[Route]):
+        id = fields.IntegerField(max_value=10**9, unique=True)
+        origin = fields.FactoryField(CountryFactory, cache=100, key="code")
+        destination = fields.FactoryField(CountryFactory, cache=100, key="code")
+
+    with cache_scope():
+        insert(connection, CachedRouteFactory, 200, chunk_size=30)
+
+    assert connection.execute("SELECT count(*) FROM route").fetchone() == (200,)
+    (countries,) = connection.execute("SELECT count(*) FROM country").fetchone()
+    assert countries <= 2 * 26
+    query = """
+        SELECT count(*) FROM route
+        JOIN country AS origin ON route.origin = origin.id
+        JOIN country AS destination ON route.destination = destination.id
+    """
+    assert connection.execute(query).fetchone() == (200,)
+
+
+def test_insert_copy() -> None:
+    connection = mock.MagicMock()
+    cursor = connection.cursor.return_value
+    stream = cursor.copy.return_value.__enter__.return_value
+
+    insert(connection, UserFactory, 3, placeholder="%s")
+
+    assert [call.args[0] for call in cursor.copy.call_args_list] == [
+        "COPY country (id, code) FROM STDIN",
+        "COPY user (id, name, country) FROM STDIN",
+    ]
+    assert stream.write_row.call_count == 6
+    cursor.executemany.assert_not_called()
+    cursor.close.assert_called_once_with()
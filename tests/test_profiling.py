@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import pytest
+
+from factorio import fields
+from factorio.factories import Factory
+from factorio.profiling import Timing, get_profile, profile
+
+
+@dataclass
+class Spam:
+    a: int
+    b: int
+
+
+@dataclass
+class Bacon:
+    x: list[Spam]
+    y: Spam
+
+
+class SpamFactory(Factory[Spam]):
+    a = fields.IntegerField(unique=True, max_value=10_000)
+    b = fields.ConstantField(1)
+
+
+class BaconFactory(Factory[Bacon]):
+    x = fields.ListField(fields.FactoryField(SpamFactory), length=3)
+    y = fields.FactoryField(SpamFactory)
+
+
+def test_profile_is_disabled_by_default() -> None:
+    assert get_profile() is None
+
+
+def test_profile_build() -> None:
+    with profile() as active:
+        assert get_profile() is active
+        BaconFactory.build()
+        BaconFactory.build(y=SpamFactory.build())
+
+    assert get_profile() is None
+    counters = active.counters()
+    assert counters["BaconFactory"].calls == 2
+    assert counters["BaconFactory.x"].calls == 2
+    assert counters["BaconFactory.y"].calls == 1
+    assert counters["SpamFactory"].calls == 8
+    assert counters["SpamFactory.a"].calls == 8
+    assert counters["SpamFactory.b"].calls == 8
+    assert counters["BaconFactory"].seconds >= counters["BaconFactory.x"].seconds
+
+
+def test_profile_build_batch() -> None:
+    with profile() as active:
+        SpamFactory.build_batch(5)
+        BaconFactory.build_batch(2)
+
+    counters = active.counters()
+    assert counters["SpamFactory"].calls == 13
+    assert counters["SpamFactory.a"].calls == 13
+    assert counters["BaconFactory"].calls == 2
+    assert counters["BaconFactory.x"].calls == 2
+
+
+def test_profile_counts_failures() -> None:
+    class FailingField(fields.AbstractField[int]):
+        def __init__(self) -> None:
+            pass
+
+        def __call__(self) -> int:
+            raise RuntimeError
+
+    class FailingFactory(Factory[Spam]):
+        a = FailingField()
+
+    with profile() as active, pytest.raises(RuntimeError):
+        FailingFactory.build()
+    with profile() as batch_profile, pytest.raises(RuntimeError):
+        FailingFactory.build_batch(3)
+
+    assert active.counters()["FailingFactory.a"].calls == 1
+    assert batch_profile.counters()["FailingFactory.a"].calls == 3
+
+
+def test_profile_counters_are_copies() -> None:
+    with profile() as active:
+        SpamFactory.build()
+
+    counters = active.counters()
+    counters["SpamFactory"].calls = 100
+    assert active.counters()["SpamFactory"] == Timing(
+        1, counters["SpamFactory"].seconds
+    )
+
+
+def test_profile_report() -> None:
+    with profile() as active:
+        BaconFactory.build()
+    active.timing("unused")
+
+    lines = active.report().splitlines()
+    assert lines[0].split() == ["name", "calls", "total", "ms", "per", "call", "µs"]
+    assert lines[1].startswith("BaconFactory ")
+    assert lines[-1].split()[1:] == ["0", "0.000", "0.000"]
+    assert {line.split()[0] for line in lines[1:]} == {
+        "BaconFactory",
+        "BaconFactory.x",
+        "BaconFactory.y",
+        "SpamFactory",
+        "SpamFactory.a",
+        "SpamFactory.b",
+        "unused",
+    }
+
+
+def test_timed_field_reset() -> None:
+    with profile() as active:
+        field = fields.IntegerField(min_value=1, max_value=1, unique=True)
+        timed = active.wrap("field", field)
+        assert active.wrap("field", field) is timed
+        assert timed() == 1
+        timed.reset()
+        assert timed.batch(1) == [1]
+
+
+def test_profile_lazy_fields() -> None:
+    @dataclass
+    class Eggs:
+        a: int
+        b: int
+
+    class EggsFactory(Factory[Eggs]):
+        a = fields.IntegerField()
+        b = fields.LazyField(lambda a: a + 1)
+
+    with profile() as active:
+        eggs = EggsFactory.build()
+        batch = EggsFactory.build_batch(3)
+
+    assert eggs.b == eggs.a + 1
+    assert all(item.b == item.a + 1 for item in batch)
+    assert active.counters()["EggsFactory.b"].calls == 4
+
+
+def test_profile_keeps_state() -> None:
+    with profile() as active:
+        assert not active.wrap("a", fields.IntegerField()).is_stateful()
+        assert active.wrap(
+            "b", fields.FactoryField(SpamFactory, pool_size=1)
+        ).is_stateful()
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import asyncio
+import csv
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import TYPE_CHECKING, NoReturn
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from factorio import fields
+from factorio.backends import RandomBackend, use_backend
+from factorio.factories import Factory
+from factorio.sinks import awrite, encode, write
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+    from factorio.sinks import Format
+
+
+@dataclass
+class Spam:
+    a: int
+    b: str
+
+
+@dataclass
+class Bacon:
+    x: int
+    y: Decimal
+    z: list[Spam]
+    t: str = "Francis"
+
+
+class SpamFactory(Factory[Spam]):
+    a = fields.IntegerField(max_value=42)
+    b = fields.ConstantField("spam")
+
+
+class BaconFactory(Factory[Bacon]):
+    x = fields.IntegerField(max_value=42)
+    y = fields.ConstantField(Decimal("1.10"))
+    z = fields.ListField(fields.FactoryField(SpamFactory), length=2)
+
+
+UTC = ZoneInfo("UTC")
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (Decimal("1.10"), "1.10"),
+        (datetime(2021, 1, 2, 3, 4, 5, tzinfo=UTC), "2021-01-02T03:04:05+00:00"),
+        (date(2021, 1, 2), "2021-01-02"),
+        (time(3, 4, 5, 6), "03:04:05.000006"),
+        (timedelta(days=1, microseconds=5), 86400.000005),
+        (ZoneInfo("Europe/Paris"), "Europe/Paris"),
+        ({3}, [3]),
+        (frozenset({3}), [3]),
+        (Spam(1, "spam"), {"a": 1, "b": "spam"}),
+        (Spam, str(Spam)),
+        (1 + 2j, "(1+2j)"),
+    ],
+)
+def test_encode(value: object, expected: object) -> None:
+    assert encode(value) == expected
+
+
+def test_dump_jsonl(tmp_path: Path) -> None:
+    path = tmp_path / "bacon.jsonl"
+    BaconFactory.dump(5, path, chunk_size=2, t="Kevin")
+    rows = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(rows) == 5
+    for row in rows:
+        assert set(row) == {"x", "y", "z", "t"}
+        assert 1 <= row["x"] <= 42
+        assert row["y"] == "1.10"
+        assert [item["b"] for item in row["z"]] == ["spam", "spam"]
+        assert row["t"] == "Kevin"
+
+
+def test_dump_csv(tmp_path: Path) -> None:
+    path = tmp_path / "bacon.csv"
+    BaconFactory.dump(5, path, format="csv", chunk_size=2, t=date(2021, 1, 2))
+    with path.open(newline="") as handle:
+        rows = list(csv.DictReader(handle))
+    assert len(rows) == 5
+    for row in rows:
+        assert list(row) == ["x", "y", "z", "t"]
+        assert 1 <= int(row["x"]) <= 42
+        assert row["y"] == "1.10"
+        assert [item["b"] for item in json.loads(row["z"])] == ["spam", "spam"]
+        assert row["t"] == "2021-01-02"
+
+
+def test_dump_columnar(tmp_path: Path) -> None:
+    path = tmp_path / "bacon.columnar"
+    BaconFactory.dump(5, path, format="columnar", chunk_size=2)
+    batches = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [len(batch["x"]) for batch in batches] == [2, 2, 1]
+    assert all(set(batch) == {"x", "y", "z"} for batch in batches)
+    assert [value for batch in batches for value in batch["y"]] == ["1.10"] * 5
+
+
+def test_dump_columnar_skips_rows(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def build_raw_batch(*_args: object, **_kwargs: object) -> NoReturn:
+        raise AssertionError
+
+    monkeypatch.setattr(BaconFactory, "build_raw_batch", build_raw_batch)
+    BaconFactory.dump(3, tmp_path / "sync.columnar", format="columnar")
+    coroutine = BaconFactory.adump(3, tmp_path / "async.columnar", format="columnar")
+    asyncio.run(coroutine)
+    for name in ("sync.columnar", "async.columnar"):
+        (batch,) = map(json.loads, (tmp_path / name).read_text().splitlines())
+        assert list(batch) == ["x", "y", "z"]
+        assert batch["y"] == ["1.10"] * 3
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ({"a": 1}, '{"a": 1}'),
+        ((1, 2), "[1, 2]"),
+        ({"a"}, '["a"]'),
+        (Decimal("1.5"), "1.5"),
+        (None, ""),
+    ],
+)
+def test_csv_values(tmp_path: Path, value: object, expected: str) -> None:
+    path = tmp_path / "values.csv"
+    write(path, ("value",), [[(value,)]], "csv")
+    with path.open(newline="") as handle:
+        assert list(csv.reader(handle)) == [["value"], [expected]]
+
+
+def test_dump_unknown_format(tmp_path: Path) -> None:
+    path = tmp_path / "bacon.xml"
+    with pytest.raises(ValueError, match="Unknown format: xml"):
+        BaconFactory.dump(5, path, format="xml")  # type: ignore[arg-type]
+    assert not path.exists()
+
+
+def test_dump_invalid_chunk_size(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Chunk size"):
+        BaconFactory.dump(5, tmp_path / "bacon.jsonl", chunk_size=0)
+
+
+@pytest.mark.parametrize("file_format", ["csv", "jsonl", "columnar"])
+def test_adump(tmp_path: Path, file_format: Format) -> None:
+    sync_path = tmp_path / "sync.out"
+    async_path = tmp_path / "async.out"
+    with use_backend(RandomBackend(seed=1)):
+        BaconFactory.dump(5, sync_path, format=file_format, chunk_size=2)
+    with use_backend(RandomBackend(seed=1)):
+        coroutine = BaconFactory.adump(5, async_path, format=file_format, chunk_size=2)
+        asyncio.run(coroutine)
+    assert async_path.read_text() == sync_path.read_text()
+
+
+def test_adump_unknown_format(tmp_path: Path) -> None:
+    path = tmp_path / "bacon.xml"
+    with pytest.raises(ValueError, match="Unknown format: xml"):
+        asyncio.run(BaconFactory.adump(5, path, format="xml"))  # type: ignore[arg-type]
+    assert not path.exists()
+
+
+def test_awrite_waits_for_pending_write(tmp_path: Path) -> None:
+    path = tmp_path / "values.jsonl"
+
+    async def chunks() -> AsyncIterator[list[tuple[object, ...]]]:
+        yield [(1,)]
+        await asyncio.sleep(0)
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(awrite(path, ("value",), chunks(), "jsonl"))
+    assert path.read_text() == '{"value": 1}\n'
+
+
+def test_adump_nothing(tmp_path: Path) -> None:
+    path = tmp_path / "bacon.csv"
+    asyncio.run(BaconFactory.adump(0, path, format="csv"))
+    assert path.read_text() == "x,y,z\n"